@@ -5,10 +5,6 @@ This module provides specialized scraping for NBA statistics
 from various sources including NBA.com, Basketball Reference, and ESPN.
 """
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
-
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 import pandas as pd
@@ -21,10 +17,50 @@ from utils.exceptions import ParsingError, NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Team abbreviations mapping
+_TEAM_ABBREVS = {
+    'Atlanta Hawks': 'ATL',
+    'Boston Celtics': 'BOS',
+    'Brooklyn Nets': 'BKN',
+    'Charlotte Hornets': 'CHA',
+    'Chicago Bulls': 'CHI',
+    'Cleveland Cavaliers': 'CLE',
+    'Dallas Mavericks': 'DAL',
+    'Denver Nuggets': 'DEN',
+    'Detroit Pistons': 'DET',
+    'Golden State Warriors': 'GSW',
+    'Houston Rockets': 'HOU',
+    'Indiana Pacers': 'IND',
+    'LA Clippers': 'LAC',
+    'Los Angeles Lakers': 'LAL',
+    'Memphis Grizzlies': 'MEM',
+    'Miami Heat': 'MIA',
+    'Milwaukee Bucks': 'MIL',
+    'Minnesota Timberwolves': 'MIN',
+    'New Orleans Pelicans': 'NOP',
+    'New York Knicks': 'NYK',
+    'Oklahoma City Thunder': 'OKC',
+    'Orlando Magic': 'ORL',
+    'Philadelphia 76ers': 'PHI',
+    'Phoenix Suns': 'PHX',
+    'Portland Trail Blazers': 'POR',
+    'Sacramento Kings': 'SAC',
+    'San Antonio Spurs': 'SAS',
+    'Toronto Raptors': 'TOR',
+    'Utah Jazz': 'UTA',
+    'Washington Wizards': 'WAS'
+}
+
+# Lowercased index for case-insensitive team lookups
+_TEAM_ABBREVS_LC = {name.lower(): abbrev for name, abbrev in _TEAM_ABBREVS.items()}
+
 
 class NBAScraper(SportsScraper):
     """NBA-specific scraper implementation"""
     
+    # Lookup table for SportsScraper._lookup_abbrev
+    _TEAM_ABBREVS_LC = _TEAM_ABBREVS_LC
+    
     def __init__(self):
         """Initialize NBA scraper"""
         super().__init__(sport='basketball', league='nba')
@@ -39,39 +75,40 @@ class NBAScraper(SportsScraper):
             'stat_muse': 'https://statmuse.com/nba'
         })
         
-        # Team abbreviations mapping
-        self.team_abbrevs = {
-            'Atlanta Hawks': 'ATL',
-            'Boston Celtics': 'BOS',
-            'Brooklyn Nets': 'BKN',
-            'Charlotte Hornets': 'CHA',
-            'Chicago Bulls': 'CHI',
-            'Cleveland Cavaliers': 'CLE',
-            'Dallas Mavericks': 'DAL',
-            'Denver Nuggets': 'DEN',
-            'Detroit Pistons': 'DET',
-            'Golden State Warriors': 'GSW',
-            'Houston Rockets': 'HOU',
-            'Indiana Pacers': 'IND',
-            'LA Clippers': 'LAC',
-            'Los Angeles Lakers': 'LAL',
-            'Memphis Grizzlies': 'MEM',
-            'Miami Heat': 'MIA',
-            'Milwaukee Bucks': 'MIL',
-            'Minnesota Timberwolves': 'MIN',
-            'New Orleans Pelicans': 'NOP',
-            'New York Knicks': 'NYK',
-            'Oklahoma City Thunder': 'OKC',
-            'Orlando Magic': 'ORL',
-            'Philadelphia 76ers': 'PHI',
-            'Phoenix Suns': 'PHX',
-            'Portland Trail Blazers': 'POR',
-            'Sacramento Kings': 'SAC',
-            'San Antonio Spurs': 'SAS',
-            'Toronto Raptors': 'TOR',
-            'Utah Jazz': 'UTA',
-            'Washington Wizards': 'WAS'
-        }
+        # Team abbreviations mapping (shared, built once at import)
+        self.team_abbrevs = _TEAM_ABBREVS
+        
+        # Season-dependent URLs, rebuilt only when the season changes
+        self.refresh_season()
+    
+    def _current_season(self, now: Optional[datetime] = None) -> int:
+        """Get the current season's end year (seasons start in October)"""
+        now = now or datetime.now()
+        return now.year + 1 if now.month >= 10 else now.year
+    
+    def _latest_playoffs_season(self, now: Optional[datetime] = None) -> int:
+        """Get the end year of the most recent completed playoffs (they end by June)"""
+        now = now or datetime.now()
+        return now.year if now.month >= 6 else now.year - 1
+    
+    def refresh_season(self, now: Optional[datetime] = None) -> None:
+        """
+        Recompute the current season and its Basketball Reference URLs
+        
+        Long-running processes should call this when crossing a season boundary.
+        
+        Args:
+            now: Reference time (defaults to now)
+        """
+        now = now or datetime.now()
+        bbref = self.sources['basketball_reference']
+        
+        self._season = self._current_season(now)
+        self._playoffs_season = self._latest_playoffs_season(now)
+        self._url_standings = f"{bbref}/leagues/NBA_{self._season}_standings.html"
+        self._url_per_game = f"{bbref}/leagues/NBA_{self._season}_per_game.html"
+        self._url_totals = f"{bbref}/leagues/NBA_{self._season}_totals.html"
+        self._url_playoffs = f"{bbref}/playoffs/NBA_{self._playoffs_season}.html"
     
     def get_standings(self, season: Optional[str] = None,
                      conference: Optional[str] = None) -> pd.DataFrame:
@@ -87,20 +124,17 @@ class NBAScraper(SportsScraper):
         """
         try:
             # Use Basketball Reference for reliable standings
-            current_year = datetime.now().year
+            now = datetime.now()
             if not season:
-                # Determine current season based on month
-                if datetime.now().month >= 10:  # Season starts in October
-                    season = str(current_year + 1)
-                else:
-                    season = str(current_year)
-            
-            url = f"{self.sources['basketball_reference']}/leagues/NBA_{season}_standings.html"
+                season = str(self._season)
+                url = self._url_standings
+            else:
+                url = f"{self.sources['basketball_reference']}/leagues/NBA_{season}_standings.html"
             
             logger.info(f"Fetching NBA standings from {url}")
             
             # Scrape the page
-            tables = self._parse_table(url)
+            tables = self._cached_parse(url, table_id='expanded_standings')
             
             if tables is not None and not tables.empty:
                 # Basketball Reference returns consolidated standings
@@ -108,10 +142,10 @@ class NBAScraper(SportsScraper):
                 
                 # Add metadata
                 standings['Conference'] = 'NBA'  # Will be split later
-                standings['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                standings['Scraped_Date'] = now.strftime('%Y-%m-%d')
                 standings['Season'] = season
                 
-                return standings
+                return self._shrink(standings)
             
             # Fallback to ESPN
             return self._get_espn_standings(season, conference)
@@ -125,14 +159,14 @@ class NBAScraper(SportsScraper):
         """Get standings from ESPN as fallback"""
         try:
             url = self.sources['espn_nba']
-            tables = self._parse_table(url)
+            tables = self._cached_parse(url)
             
             if tables is not None and not tables.empty:
                 # Add metadata
                 tables['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
                 tables['Source'] = 'ESPN'
                 
-                return tables
+                return self._shrink(tables)
             
             return pd.DataFrame()
             
@@ -165,7 +199,7 @@ class NBAScraper(SportsScraper):
             logger.info(f"Fetching NBA scores for {date_str}")
             
             # Try to get scores table
-            scores_data = self._parse_table(url)
+            scores_data = self._cached_parse(url, ttl_seconds=300)
             
             if scores_data is not None and not scores_data.empty:
                 # Add date column
@@ -174,15 +208,9 @@ class NBAScraper(SportsScraper):
                 # Filter by team if specified
                 if team and not scores_data.empty:
                     # Look for team in any column that might contain team names
-                    team_mask = False
-                    for col in scores_data.columns:
-                        if scores_data[col].dtype == 'object':
-                            team_mask |= scores_data[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        scores_data = scores_data[team_mask]
+                    scores_data = self._filter_rows_containing(scores_data, team)
                 
-                return scores_data
+                return self._shrink(scores_data)
             
             return pd.DataFrame()
             
@@ -206,40 +234,36 @@ class NBAScraper(SportsScraper):
         """
         try:
             # Use Basketball Reference for comprehensive stats
-            current_year = datetime.now().year
-            if datetime.now().month >= 10:
-                season = current_year + 1
-            else:
-                season = current_year
-                
+            now = datetime.now()
+            
             if stat_type == 'season':
-                url = f"{self.sources['basketball_reference']}/leagues/NBA_{season}_per_game.html"
+                url = self._url_per_game
+                table_id = 'per_game_stats'
             else:
-                url = f"{self.sources['basketball_reference']}/leagues/NBA_{season}_totals.html"
+                url = self._url_totals
+                table_id = 'totals_stats'
             
             logger.info(f"Fetching NBA player {stat_type} stats")
             
-            stats_df = self._parse_table(url)
+            stats_df = self._cached_parse(url, table_id=table_id)
             
             if stats_df is not None and not stats_df.empty:
                 # Filter by player if specified
                 if player and 'Player' in stats_df.columns:
-                    stats_df = stats_df[
-                        stats_df['Player'].str.contains(player, case=False, na=False)
-                    ]
+                    stats_df = stats_df[self._contains_ci(stats_df['Player'], player)]
                 
                 # Filter by team if specified
                 if team and 'Tm' in stats_df.columns:
-                    team_abbrev = self.team_abbrevs.get(team, team.upper())
+                    team_abbrev = self._lookup_abbrev(team)
                     stats_df = stats_df[
                         stats_df['Tm'] == team_abbrev
                     ]
                 
                 # Add metadata
                 stats_df['Stat_Type'] = stat_type
-                stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                stats_df['Scraped_Date'] = now.strftime('%Y-%m-%d')
                 
-                return stats_df
+                return self._shrink(stats_df)
             
             return pd.DataFrame()
             
@@ -265,25 +289,19 @@ class NBAScraper(SportsScraper):
             
             logger.info(f"Fetching NBA team {stat_type} stats")
             
-            team_stats_df = self._parse_table(url)
+            team_stats_df = self._cached_parse(url)
             
             if team_stats_df is not None and not team_stats_df.empty:
                 # Filter by team if specified
                 if team:
                     # Look for team in any column
-                    team_mask = False
-                    for col in team_stats_df.columns:
-                        if team_stats_df[col].dtype == 'object':
-                            team_mask |= team_stats_df[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        team_stats_df = team_stats_df[team_mask]
+                    team_stats_df = self._filter_rows_containing(team_stats_df, team)
                 
                 # Add metadata
                 team_stats_df['Stat_Type'] = stat_type
                 team_stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
                 
-                return team_stats_df
+                return self._shrink(team_stats_df)
             
             return pd.DataFrame()
             
@@ -296,14 +314,14 @@ class NBAScraper(SportsScraper):
         """Get NBA schedule"""
         try:
             if team:
-                team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
+                team_abbrev = self._lookup_abbrev(team).lower()
                 url = f"https://www.espn.com/nba/team/schedule/_/name/{team_abbrev}"
             else:
                 url = "https://www.espn.com/nba/schedule"
             
             logger.info(f"Fetching NBA schedule")
             
-            schedule_df = self._parse_table(url)
+            schedule_df = self._cached_parse(url)
             
             if schedule_df is not None and not schedule_df.empty:
                 # Add metadata
@@ -311,11 +329,9 @@ class NBAScraper(SportsScraper):
                 
                 # Filter by month if specified
                 if month and 'Date' in schedule_df.columns:
-                    schedule_df = schedule_df[
-                        schedule_df['Date'].str.contains(month, case=False, na=False)
-                    ]
+                    schedule_df = schedule_df[self._contains_ci(schedule_df['Date'], month)]
                 
-                return schedule_df
+                return self._shrink(schedule_df)
             
             return pd.DataFrame()
             
@@ -330,20 +346,20 @@ class NBAScraper(SportsScraper):
                 logger.warning("Team name required for roster lookup")
                 return pd.DataFrame()
                 
-            team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
+            team_abbrev = self._lookup_abbrev(team).lower()
             url = f"https://www.espn.com/nba/team/roster/_/name/{team_abbrev}"
             
             logger.info(f"Fetching roster for {team}")
             
-            roster_df = self._parse_table(url)
+            roster_df = self._cached_parse(url, ttl_seconds=86400)
             
             if roster_df is not None and not roster_df.empty:
                 # Add team info
                 roster_df['Team'] = team
-                roster_df['Team_Abbrev'] = self.team_abbrevs.get(team, team.upper())
+                roster_df['Team_Abbrev'] = self._lookup_abbrev(team)
                 roster_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
                 
-                return roster_df
+                return self._shrink(roster_df)
             
             return pd.DataFrame()
             
@@ -358,11 +374,11 @@ class NBAScraper(SportsScraper):
             
             logger.info("Fetching NBA injury report")
             
-            injuries_df = self._parse_table(url)
+            injuries_df = self._cached_parse(url, ttl_seconds=900)
             
             if injuries_df is not None and not injuries_df.empty:
                 injuries_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return injuries_df
+                return self._shrink(injuries_df)
             
             return pd.DataFrame()
             
@@ -373,23 +389,21 @@ class NBAScraper(SportsScraper):
     def get_playoffs(self, season: Optional[str] = None) -> pd.DataFrame:
         """Get NBA playoff bracket"""
         try:
+            now = datetime.now()
             if not season:
-                current_year = datetime.now().year
-                if datetime.now().month >= 6:  # Playoffs end by June
-                    season = str(current_year)
-                else:
-                    season = str(current_year - 1)
-            
-            url = f"{self.sources['basketball_reference']}/playoffs/NBA_{season}.html"
+                season = str(self._playoffs_season)
+                url = self._url_playoffs
+            else:
+                url = f"{self.sources['basketball_reference']}/playoffs/NBA_{season}.html"
             
             logger.info(f"Fetching NBA playoff data for {season}")
             
-            playoff_df = self._parse_table(url)
+            playoff_df = self._cached_parse(url)
             
             if playoff_df is not None and not playoff_df.empty:
                 playoff_df['Season'] = season
-                playoff_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return playoff_df
+                playoff_df['Scraped_Date'] = now.strftime('%Y-%m-%d')
+                return self._shrink(playoff_df)
             
             return pd.DataFrame()
             
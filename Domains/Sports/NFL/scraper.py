@@ -5,10 +5,6 @@ This module provides specialized scraping for NFL statistics
 from various sources including NFL.com, Pro Football Reference, and ESPN.
 """
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
-
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 import pandas as pd
@@ -21,10 +17,69 @@ from utils.exceptions import ParsingError, NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Team abbreviations mapping
+_TEAM_ABBREVS = {
+    'Arizona Cardinals': 'ARI',
+    'Atlanta Falcons': 'ATL',
+    'Baltimore Ravens': 'BAL',
+    'Buffalo Bills': 'BUF',
+    'Carolina Panthers': 'CAR',
+    'Chicago Bears': 'CHI',
+    'Cincinnati Bengals': 'CIN',
+    'Cleveland Browns': 'CLE',
+    'Dallas Cowboys': 'DAL',
+    'Denver Broncos': 'DEN',
+    'Detroit Lions': 'DET',
+    'Green Bay Packers': 'GB',
+    'Houston Texans': 'HOU',
+    'Indianapolis Colts': 'IND',
+    'Jacksonville Jaguars': 'JAX',
+    'Kansas City Chiefs': 'KC',
+    'Las Vegas Raiders': 'LV',
+    'Los Angeles Chargers': 'LAC',
+    'Los Angeles Rams': 'LAR',
+    'Miami Dolphins': 'MIA',
+    'Minnesota Vikings': 'MIN',
+    'New England Patriots': 'NE',
+    'New Orleans Saints': 'NO',
+    'New York Giants': 'NYG',
+    'New York Jets': 'NYJ',
+    'Philadelphia Eagles': 'PHI',
+    'Pittsburgh Steelers': 'PIT',
+    'San Francisco 49ers': 'SF',
+    'Seattle Seahawks': 'SEA',
+    'Tampa Bay Buccaneers': 'TB',
+    'Tennessee Titans': 'TEN',
+    'Washington Commanders': 'WAS'
+}
+
+# Lowercased index for case-insensitive team lookups
+_TEAM_ABBREVS_LC = {name.lower(): abbrev for name, abbrev in _TEAM_ABBREVS.items()}
+
+# Endpoint URL templates ({base} is the Pro Football Reference base URL)
+_URLS = {
+    'pfr_season': '{base}/years/{year}/',
+    'pfr_player_stats': '{base}/years/{year}/{table_id}.htm',
+    'pfr_playoffs': '{base}/years/{season}/playoffs.htm',
+    'pfr_draft': '{base}/years/{year}/draft.htm',
+    'espn_scores': 'https://www.espn.com/nfl/scoreboard/_/date/{date}',
+    'espn_schedule': 'https://www.espn.com/nfl/schedule',
+    'espn_team_schedule': 'https://www.espn.com/nfl/team/schedule/_/name/{team}',
+    'espn_roster': 'https://www.espn.com/nfl/team/roster/_/name/{team}',
+    'espn_injuries': 'https://www.espn.com/nfl/injuries',
+}
+
 
 class NFLScraper(SportsScraper):
     """NFL-specific scraper implementation"""
     
+    # Lookup table for SportsScraper._lookup_abbrev
+    _TEAM_ABBREVS_LC = _TEAM_ABBREVS_LC
+    
+    # Templates for SportsScraper._url
+    _URLS = _URLS
+    _URL_BASE_SOURCE = 'pro_football_reference'
+    
     def __init__(self):
         """Initialize NFL scraper"""
         super().__init__(sport='football', league='nfl')
@@ -39,41 +94,13 @@ class NFLScraper(SportsScraper):
             'nfl_savant': 'https://www.nflsavant.com'
         })
         
-        # Team abbreviations mapping
-        self.team_abbrevs = {
-            'Arizona Cardinals': 'ARI',
-            'Atlanta Falcons': 'ATL',
-            'Baltimore Ravens': 'BAL',
-            'Buffalo Bills': 'BUF',
-            'Carolina Panthers': 'CAR',
-            'Chicago Bears': 'CHI',
-            'Cincinnati Bengals': 'CIN',
-            'Cleveland Browns': 'CLE',
-            'Dallas Cowboys': 'DAL',
-            'Denver Broncos': 'DEN',
-            'Detroit Lions': 'DET',
-            'Green Bay Packers': 'GB',
-            'Houston Texans': 'HOU',
-            'Indianapolis Colts': 'IND',
-            'Jacksonville Jaguars': 'JAX',
-            'Kansas City Chiefs': 'KC',
-            'Las Vegas Raiders': 'LV',
-            'Los Angeles Chargers': 'LAC',
-            'Los Angeles Rams': 'LAR',
-            'Miami Dolphins': 'MIA',
-            'Minnesota Vikings': 'MIN',
-            'New England Patriots': 'NE',
-            'New Orleans Saints': 'NO',
-            'New York Giants': 'NYG',
-            'New York Jets': 'NYJ',
-            'Philadelphia Eagles': 'PHI',
-            'Pittsburgh Steelers': 'PIT',
-            'San Francisco 49ers': 'SF',
-            'Seattle Seahawks': 'SEA',
-            'Tampa Bay Buccaneers': 'TB',
-            'Tennessee Titans': 'TEN',
-            'Washington Commanders': 'WAS'
-        }
+        # Team abbreviations mapping (shared, built once at import)
+        self.team_abbrevs = _TEAM_ABBREVS
+    
+    def _current_season(self, now: Optional[datetime] = None) -> int:
+        """Get the current season's year (seasons run September to February)"""
+        now = now or datetime.now()
+        return now.year - 1 if now.month <= 2 else now.year
     
     def get_standings(self, season: Optional[str] = None,
                      conference: Optional[str] = None) -> pd.DataFrame:
@@ -88,23 +115,28 @@ class NFLScraper(SportsScraper):
             DataFrame with standings
         """
         try:
-            # Use ESPN for standings
-            url = self.sources['espn_nfl']
+            # ESPN's JSON API first, ESPN stats page as fallback
+            now = datetime.now()
+            logger.info(f"Fetching NFL standings")
             
-            logger.info(f"Fetching NFL standings from {url}")
+            tables = self._get_espn_standings(season, group=conference)
             
-            # Scrape the page
-            tables = self._parse_table(url)
+            if tables is None or tables.empty:
+                url = self.sources['espn_nfl']
+                logger.info(f"Falling back to standings page {url}")
+                tables = self._cached_parse(url)
             
             if tables is not None and not tables.empty:
                 standings = tables
                 
                 # Add metadata
-                standings['Conference'] = conference or 'NFL'
-                standings['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                standings['Season'] = season or str(datetime.now().year)
+                standings = standings.assign(
+                    Conference=conference or 'NFL',
+                    Scraped_Date=now.strftime('%Y-%m-%d'),
+                    Season=season or str(self._current_season(now))
+                )
                 
-                return standings
+                return self._shrink(standings)
             
             # Try Pro Football Reference as fallback
             return self._get_pfr_standings(season)
@@ -116,17 +148,20 @@ class NFLScraper(SportsScraper):
     def _get_pfr_standings(self, season: Optional[str] = None) -> pd.DataFrame:
         """Get standings from Pro Football Reference"""
         try:
-            year = season or str(datetime.now().year)
-            url = f"{self.sources['pro_football_reference']}/years/{year}/"
+            now = datetime.now()
+            year = season or str(self._current_season(now))
+            url = self._url('pfr_season', year=year)
             
-            tables = self._parse_table(url)
+            tables = self._cached_parse(url)
             
             if tables is not None and not tables.empty:
                 # Add metadata
-                tables['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                tables['Source'] = 'Pro Football Reference'
+                tables = tables.assign(
+                    Scraped_Date=now.strftime('%Y-%m-%d'),
+                    Source='Pro Football Reference'
+                )
                 
-                return tables
+                return self._shrink(tables)
             
             return pd.DataFrame()
             
@@ -153,13 +188,14 @@ class NFLScraper(SportsScraper):
             # Format date for URL
             date_str = date.strftime('%Y%m%d')
             
-            # Use ESPN for scores
-            url = f"https://www.espn.com/nfl/scoreboard/_/date/{date_str}"
-            
             logger.info(f"Fetching NFL scores for {date_str}")
             
-            # Try to get scores table
-            scores_data = self._parse_table(url)
+            # ESPN's JSON API first, scoreboard page as fallback
+            scores_data = self._get_espn_scoreboard(date_str)
+            
+            if scores_data is None or scores_data.empty:
+                url = self._url('espn_scores', date=date_str)
+                scores_data = self._cached_parse(url, ttl_seconds=300)
             
             if scores_data is not None and not scores_data.empty:
                 # Add date column
@@ -168,15 +204,9 @@ class NFLScraper(SportsScraper):
                 # Filter by team if specified
                 if team and not scores_data.empty:
                     # Look for team in any column
-                    team_mask = False
-                    for col in scores_data.columns:
-                        if scores_data[col].dtype == 'object':
-                            team_mask |= scores_data[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        scores_data = scores_data[team_mask]
+                    scores_data = self._filter_rows_containing(scores_data, team)
                 
-                return scores_data
+                return self._shrink(scores_data)
             
             return pd.DataFrame()
             
@@ -202,43 +232,45 @@ class NFLScraper(SportsScraper):
         """
         try:
             # Use Pro Football Reference for comprehensive stats
-            year = datetime.now().year
+            now = datetime.now()
+            year = self._current_season(now)
             
             # Different URLs for different positions
-            if position and position.upper() == 'QB':
-                url = f"{self.sources['pro_football_reference']}/years/{year}/passing.htm"
-            elif position and position.upper() in ['RB', 'FB']:
-                url = f"{self.sources['pro_football_reference']}/years/{year}/rushing.htm"
+            if position and position.upper() in ['RB', 'FB']:
+                table_id = 'rushing'
             elif position and position.upper() in ['WR', 'TE']:
-                url = f"{self.sources['pro_football_reference']}/years/{year}/receiving.htm"
+                table_id = 'receiving'
             else:
-                # Default to passing stats
-                url = f"{self.sources['pro_football_reference']}/years/{year}/passing.htm"
+                # QB and default: passing stats
+                table_id = 'passing'
+            
+            # Each page's stats table id matches its page name
+            url = self._url('pfr_player_stats', year=year, table_id=table_id)
             
             logger.info(f"Fetching NFL player {stat_type} stats")
             
-            stats_df = self._parse_table(url)
+            stats_df = self._cached_parse(url, table_id=table_id)
             
             if stats_df is not None and not stats_df.empty:
                 # Filter by player if specified
                 if player and 'Player' in stats_df.columns:
-                    stats_df = stats_df[
-                        stats_df['Player'].str.contains(player, case=False, na=False)
-                    ]
+                    stats_df = stats_df[self._contains_ci(stats_df['Player'], player)]
                 
                 # Filter by team if specified
                 if team and 'Tm' in stats_df.columns:
-                    team_abbrev = self.team_abbrevs.get(team, team.upper())
+                    team_abbrev = self._lookup_abbrev(team)
                     stats_df = stats_df[
                         stats_df['Tm'] == team_abbrev
                     ]
                 
                 # Add metadata
-                stats_df['Stat_Type'] = stat_type
-                stats_df['Position_Group'] = position or 'All'
-                stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                stats_df = stats_df.assign(
+                    Stat_Type=stat_type,
+                    Position_Group=position or 'All',
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return stats_df
+                return self._shrink(stats_df)
             
             return pd.DataFrame()
             
@@ -264,25 +296,21 @@ class NFLScraper(SportsScraper):
             
             logger.info(f"Fetching NFL team {stat_type} stats")
             
-            team_stats_df = self._parse_table(url)
+            team_stats_df = self._cached_parse(url)
             
             if team_stats_df is not None and not team_stats_df.empty:
                 # Filter by team if specified
                 if team:
                     # Look for team in any column
-                    team_mask = False
-                    for col in team_stats_df.columns:
-                        if team_stats_df[col].dtype == 'object':
-                            team_mask |= team_stats_df[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        team_stats_df = team_stats_df[team_mask]
+                    team_stats_df = self._filter_rows_containing(team_stats_df, team)
                 
                 # Add metadata
-                team_stats_df['Stat_Type'] = stat_type
-                team_stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                team_stats_df = team_stats_df.assign(
+                    Stat_Type=stat_type,
+                    Scraped_Date=datetime.now().strftime('%Y-%m-%d')
+                )
                 
-                return team_stats_df
+                return self._shrink(team_stats_df)
             
             return pd.DataFrame()
             
@@ -295,14 +323,14 @@ class NFLScraper(SportsScraper):
         """Get NFL schedule"""
         try:
             if team:
-                team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
-                url = f"https://www.espn.com/nfl/team/schedule/_/name/{team_abbrev}"
+                team_abbrev = self._lookup_abbrev(team).lower()
+                url = self._url('espn_team_schedule', team=team_abbrev)
             else:
-                url = "https://www.espn.com/nfl/schedule"
+                url = self._url('espn_schedule')
             
             logger.info(f"Fetching NFL schedule")
             
-            schedule_df = self._parse_table(url)
+            schedule_df = self._cached_parse(url)
             
             if schedule_df is not None and not schedule_df.empty:
                 # Add metadata
@@ -312,7 +340,7 @@ class NFLScraper(SportsScraper):
                 if week and 'Week' in schedule_df.columns:
                     schedule_df = schedule_df[schedule_df['Week'] == str(week)]
                 
-                return schedule_df
+                return self._shrink(schedule_df)
             
             return pd.DataFrame()
             
@@ -327,20 +355,26 @@ class NFLScraper(SportsScraper):
                 logger.warning("Team name required for roster lookup")
                 return pd.DataFrame()
                 
-            team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
-            url = f"https://www.espn.com/nfl/team/roster/_/name/{team_abbrev}"
+            team_abbrev = self._lookup_abbrev(team).lower()
             
             logger.info(f"Fetching roster for {team}")
             
-            roster_df = self._parse_table(url)
+            # ESPN's JSON API first, roster page as fallback
+            roster_df = self._get_espn_roster(team_abbrev)
+            
+            if roster_df is None or roster_df.empty:
+                url = self._url('espn_roster', team=team_abbrev)
+                roster_df = self._cached_parse(url, ttl_seconds=86400)
             
             if roster_df is not None and not roster_df.empty:
                 # Add team info
-                roster_df['Team'] = team
-                roster_df['Team_Abbrev'] = self.team_abbrevs.get(team, team.upper())
-                roster_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                roster_df = roster_df.assign(
+                    Team=team,
+                    Team_Abbrev=self._lookup_abbrev(team),
+                    Scraped_Date=datetime.now().strftime('%Y-%m-%d')
+                )
                 
-                return roster_df
+                return self._shrink(roster_df)
             
             return pd.DataFrame()
             
@@ -351,15 +385,15 @@ class NFLScraper(SportsScraper):
     def get_injuries(self) -> pd.DataFrame:
         """Get NFL injury report"""
         try:
-            url = "https://www.espn.com/nfl/injuries"
+            url = self._url('espn_injuries')
             
             logger.info("Fetching NFL injury report")
             
-            injuries_df = self._parse_table(url)
+            injuries_df = self._cached_parse(url, ttl_seconds=900)
             
             if injuries_df is not None and not injuries_df.empty:
                 injuries_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return injuries_df
+                return self._shrink(injuries_df)
             
             return pd.DataFrame()
             
@@ -370,24 +404,22 @@ class NFLScraper(SportsScraper):
     def get_playoffs(self, season: Optional[str] = None) -> pd.DataFrame:
         """Get NFL playoff bracket"""
         try:
+            now = datetime.now()
             if not season:
-                # NFL season runs from September to February
-                current_year = datetime.now().year
-                if datetime.now().month <= 2:
-                    season = str(current_year - 1)
-                else:
-                    season = str(current_year)
+                season = str(self._current_season(now))
             
-            url = f"{self.sources['pro_football_reference']}/years/{season}/playoffs.htm"
+            url = self._url('pfr_playoffs', season=season)
             
             logger.info(f"Fetching NFL playoff data for {season}")
             
-            playoff_df = self._parse_table(url)
+            playoff_df = self._cached_parse(url)
             
             if playoff_df is not None and not playoff_df.empty:
-                playoff_df['Season'] = season
-                playoff_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return playoff_df
+                playoff_df = playoff_df.assign(
+                    Season=season,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
+                return self._shrink(playoff_df)
             
             return pd.DataFrame()
             
@@ -410,19 +442,20 @@ class NFLScraper(SportsScraper):
             DataFrame with draft picks
         """
         try:
+            now = datetime.now()
             if not year:
-                year = datetime.now().year
+                year = now.year
             
-            url = f"{self.sources['pro_football_reference']}/years/{year}/draft.htm"
+            url = self._url('pfr_draft', year=year)
             
             logger.info(f"Fetching NFL draft picks for {year}")
             
-            draft_df = self._parse_table(url)
+            draft_df = self._cached_parse(url, ttl_seconds=86400)
             
             if draft_df is not None and not draft_df.empty:
                 # Filter by team if specified
                 if team and 'Tm' in draft_df.columns:
-                    team_abbrev = self.team_abbrevs.get(team, team.upper())
+                    team_abbrev = self._lookup_abbrev(team)
                     draft_df = draft_df[draft_df['Tm'] == team_abbrev]
                 
                 # Filter by round if specified
@@ -430,10 +463,12 @@ class NFLScraper(SportsScraper):
                     draft_df = draft_df[draft_df['Rnd'] == str(round)]
                 
                 # Add metadata
-                draft_df['Draft_Year'] = year
-                draft_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                draft_df = draft_df.assign(
+                    Draft_Year=year,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return draft_df
+                return self._shrink(draft_df)
             
             return pd.DataFrame()
             
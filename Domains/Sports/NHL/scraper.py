@@ -5,12 +5,9 @@ This module provides specialized scraping for NHL statistics
 from various sources including NHL.com, Hockey Reference, and ESPN.
 """
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
-
 from typing import Optional, Dict, List, Any
 from datetime import datetime
+from functools import lru_cache, partial
 import pandas as pd
 import logging
 from urllib.parse import urljoin
@@ -21,10 +18,91 @@ from utils.exceptions import ParsingError, NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Team abbreviations mapping
+_TEAM_ABBREVS = {
+    'Anaheim Ducks': 'ANA',
+    'Arizona Coyotes': 'ARI',
+    'Boston Bruins': 'BOS',
+    'Buffalo Sabres': 'BUF',
+    'Calgary Flames': 'CGY',
+    'Carolina Hurricanes': 'CAR',
+    'Chicago Blackhawks': 'CHI',
+    'Colorado Avalanche': 'COL',
+    'Columbus Blue Jackets': 'CBJ',
+    'Dallas Stars': 'DAL',
+    'Detroit Red Wings': 'DET',
+    'Edmonton Oilers': 'EDM',
+    'Florida Panthers': 'FLA',
+    'Los Angeles Kings': 'LAK',
+    'Minnesota Wild': 'MIN',
+    'Montreal Canadiens': 'MTL',
+    'Nashville Predators': 'NSH',
+    'New Jersey Devils': 'NJD',
+    'New York Islanders': 'NYI',
+    'New York Rangers': 'NYR',
+    'Ottawa Senators': 'OTT',
+    'Philadelphia Flyers': 'PHI',
+    'Pittsburgh Penguins': 'PIT',
+    'San Jose Sharks': 'SJS',
+    'Seattle Kraken': 'SEA',
+    'St. Louis Blues': 'STL',
+    'Tampa Bay Lightning': 'TBL',
+    'Toronto Maple Leafs': 'TOR',
+    'Vancouver Canucks': 'VAN',
+    'Vegas Golden Knights': 'VGK',
+    'Washington Capitals': 'WSH',
+    'Winnipeg Jets': 'WPG'
+}
+
+# Lowercased index for case-insensitive team lookups
+_TEAM_ABBREVS_LC = {name.lower(): abbrev for name, abbrev in _TEAM_ABBREVS.items()}
+
+# Endpoint URL templates ({base} is the Hockey Reference base URL)
+_URLS = {
+    'hr_standings': '{base}/leagues/NHL_{year}_standings.html',
+    'hr_skaters': '{base}/leagues/NHL_{year}_skaters.html',
+    'hr_goalies': '{base}/leagues/NHL_{year}_goalies.html',
+    'hr_playoffs': '{base}/playoffs/NHL_{year}.html',
+    'hr_draft': '{base}/draft/NHL_{year}_entry.html',
+    'espn_scores': 'https://www.espn.com/nhl/scoreboard/_/date/{date}',
+    'espn_schedule': 'https://www.espn.com/nhl/schedule',
+    'espn_team_schedule': 'https://www.espn.com/nhl/team/schedule/_/name/{team}',
+    'espn_roster': 'https://www.espn.com/nhl/team/roster/_/name/{team}',
+    'espn_injuries': 'https://www.espn.com/nhl/injuries',
+}
+
+# Parsed-table TTL for pages that no longer change (past drafts and playoffs)
+_FINAL_TTL = 365 * 86400
+
+
+@lru_cache(maxsize=16)
+def _season_for(year: int, month: int) -> str:
+    """Get the NHL season string for a calendar month, e.g. (2024, 11) -> '2024-25'"""
+    # NHL season runs from October to June
+    if month >= 10:
+        return f"{year}-{(year + 1) % 100:02d}"
+    else:
+        return f"{year - 1}-{year % 100:02d}"
+
+
+def _season_end_year(season: str) -> int:
+    """Get the calendar year a season ends in, e.g. '2023-24' -> 2024"""
+    year = int(season.split('-')[-1])
+    if year < 100:
+        year += 2000
+    return year
+
 
 class NHLScraper(SportsScraper):
     """NHL-specific scraper implementation"""
     
+    # Lookup table for SportsScraper._lookup_abbrev
+    _TEAM_ABBREVS_LC = _TEAM_ABBREVS_LC
+    
+    # Templates for SportsScraper._url
+    _URLS = _URLS
+    _URL_BASE_SOURCE = 'hockey_reference'
+    
     def __init__(self):
         """Initialize NHL scraper"""
         super().__init__(sport='hockey', league='nhl')
@@ -39,41 +117,8 @@ class NHLScraper(SportsScraper):
             'moneypuck': 'https://moneypuck.com'
         })
         
-        # Team abbreviations mapping
-        self.team_abbrevs = {
-            'Anaheim Ducks': 'ANA',
-            'Arizona Coyotes': 'ARI',
-            'Boston Bruins': 'BOS',
-            'Buffalo Sabres': 'BUF',
-            'Calgary Flames': 'CGY',
-            'Carolina Hurricanes': 'CAR',
-            'Chicago Blackhawks': 'CHI',
-            'Colorado Avalanche': 'COL',
-            'Columbus Blue Jackets': 'CBJ',
-            'Dallas Stars': 'DAL',
-            'Detroit Red Wings': 'DET',
-            'Edmonton Oilers': 'EDM',
-            'Florida Panthers': 'FLA',
-            'Los Angeles Kings': 'LAK',
-            'Minnesota Wild': 'MIN',
-            'Montreal Canadiens': 'MTL',
-            'Nashville Predators': 'NSH',
-            'New Jersey Devils': 'NJD',
-            'New York Islanders': 'NYI',
-            'New York Rangers': 'NYR',
-            'Ottawa Senators': 'OTT',
-            'Philadelphia Flyers': 'PHI',
-            'Pittsburgh Penguins': 'PIT',
-            'San Jose Sharks': 'SJS',
-            'Seattle Kraken': 'SEA',
-            'St. Louis Blues': 'STL',
-            'Tampa Bay Lightning': 'TBL',
-            'Toronto Maple Leafs': 'TOR',
-            'Vancouver Canucks': 'VAN',
-            'Vegas Golden Knights': 'VGK',
-            'Washington Capitals': 'WSH',
-            'Winnipeg Jets': 'WPG'
-        }
+        # Team abbreviations mapping (shared, built once at import)
+        self.team_abbrevs = _TEAM_ABBREVS
     
     def get_standings(self, season: Optional[str] = None,
                      conference: Optional[str] = None) -> pd.DataFrame:
@@ -88,23 +133,27 @@ class NHLScraper(SportsScraper):
             DataFrame with standings
         """
         try:
+            now = datetime.now()
+            
             # Use ESPN for standings
             url = self.sources['espn_nhl']
             
             logger.info(f"Fetching NHL standings from {url}")
             
             # Scrape the page
-            tables = self._parse_table(url)
+            tables = self._cached_parse(url)
             
-            if tables is not None and not tables.empty:
+            if tables is not None:
                 standings = tables
                 
                 # Add metadata
-                standings['Conference'] = conference or 'NHL'
-                standings['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                standings['Season'] = season or self._get_current_season()
+                standings = standings.assign(
+                    Conference=conference or 'NHL',
+                    Scraped_Date=now.strftime('%Y-%m-%d'),
+                    Season=season or self._get_current_season(now)
+                )
                 
-                return standings
+                return self._shrink(standings)
             
             # Try Hockey Reference as fallback
             return self._get_hockey_ref_standings(season)
@@ -113,35 +162,32 @@ class NHLScraper(SportsScraper):
             logger.error(f"Error getting NHL standings: {str(e)}")
             return pd.DataFrame()
     
-    def _get_current_season(self) -> str:
+    def _get_current_season(self, now: Optional[datetime] = None) -> str:
         """Get current NHL season string"""
-        now = datetime.now()
-        # NHL season runs from October to June
-        if now.month >= 10:
-            return f"{now.year}-{str(now.year + 1)[2:]}"
-        else:
-            return f"{now.year - 1}-{str(now.year)[2:]}"
+        now = now or datetime.now()
+        return _season_for(now.year, now.month)
     
     def _get_hockey_ref_standings(self, season: Optional[str] = None) -> pd.DataFrame:
         """Get standings from Hockey Reference"""
         try:
+            now = datetime.now()
             if not season:
-                season = self._get_current_season()
-            year = season.split('-')[1]
-            if len(year) == 2:
-                year = '20' + year
+                season = self._get_current_season(now)
+            year = _season_end_year(season)
             
-            url = f"{self.sources['hockey_reference']}/leagues/NHL_{year}_standings.html"
+            url = self._url('hr_standings', year=year)
             
-            tables = self._parse_table(url)
+            tables = self._cached_parse(url, table_id='expanded_standings')
             
-            if tables is not None and not tables.empty:
+            if tables is not None:
                 # Add metadata
-                tables['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                tables['Source'] = 'Hockey Reference'
-                tables['Season'] = season
+                tables = tables.assign(
+                    Scraped_Date=now.strftime('%Y-%m-%d'),
+                    Source='Hockey Reference',
+                    Season=season
+                )
                 
-                return tables
+                return self._shrink(tables)
             
             return pd.DataFrame()
             
@@ -169,29 +215,23 @@ class NHLScraper(SportsScraper):
             date_str = date.strftime('%Y%m%d')
             
             # Use ESPN for scores
-            url = f"https://www.espn.com/nhl/scoreboard/_/date/{date_str}"
+            url = self._url('espn_scores', date=date_str)
             
             logger.info(f"Fetching NHL scores for {date_str}")
             
             # Try to get scores table
-            scores_data = self._parse_table(url)
+            scores_data = self._cached_parse(url, ttl_seconds=300)
             
-            if scores_data is not None and not scores_data.empty:
+            if scores_data is not None:
                 # Add date column
                 scores_data['Date'] = date.strftime('%Y-%m-%d')
                 
                 # Filter by team if specified
                 if team and not scores_data.empty:
                     # Look for team in any column
-                    team_mask = False
-                    for col in scores_data.columns:
-                        if scores_data[col].dtype == 'object':
-                            team_mask |= scores_data[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        scores_data = scores_data[team_mask]
+                    scores_data = self._filter_rows_containing(scores_data, team)
                 
-                return scores_data
+                return self._shrink(scores_data)
             
             return pd.DataFrame()
             
@@ -202,7 +242,8 @@ class NHLScraper(SportsScraper):
     def get_player_stats(self, stat_type: str = 'season',
                         player: Optional[str] = None,
                         team: Optional[str] = None,
-                        position: Optional[str] = None) -> pd.DataFrame:
+                        position: Optional[str] = None,
+                        season: Optional[str] = None) -> pd.DataFrame:
         """
         Get NHL player statistics
         
@@ -211,53 +252,55 @@ class NHLScraper(SportsScraper):
             player: Player name filter
             team: Team filter
             position: Position filter (C, LW, RW, D, G)
+            season: Season (e.g., '2023-24'), defaults to the current one
             
         Returns:
             DataFrame with player stats
         """
         try:
+            now = datetime.now()
+            
             # Use Hockey Reference for comprehensive stats
-            season = self._get_current_season()
-            year = season.split('-')[1]
-            if len(year) == 2:
-                year = '20' + year
+            if not season:
+                season = self._get_current_season(now)
+            year = _season_end_year(season)
             
             # Different URLs for different stat types
             if position and position.upper() == 'G':
-                url = f"{self.sources['hockey_reference']}/leagues/NHL_{year}_goalies.html"
+                url = self._url('hr_goalies', year=year)
+                table_id = 'goalie_stats'
             else:
-                url = f"{self.sources['hockey_reference']}/leagues/NHL_{year}_skaters.html"
+                url = self._url('hr_skaters', year=year)
+                table_id = 'player_stats'
             
             logger.info(f"Fetching NHL player {stat_type} stats")
             
-            stats_df = self._parse_table(url)
+            stats_df = self._cached_parse(url, ttl_seconds=86400, table_id=table_id)
             
-            if stats_df is not None and not stats_df.empty:
+            if stats_df is not None:
                 # Filter by player if specified
                 if player and 'Player' in stats_df.columns:
-                    stats_df = stats_df[
-                        stats_df['Player'].str.contains(player, case=False, na=False)
-                    ]
+                    stats_df = stats_df[self._contains_ci(stats_df['Player'], player)]
                 
                 # Filter by team if specified
                 if team and 'Tm' in stats_df.columns:
-                    team_abbrev = self.team_abbrevs.get(team, team.upper())
+                    team_abbrev = self._lookup_abbrev(team)
                     stats_df = stats_df[
                         stats_df['Tm'] == team_abbrev
                     ]
                 
                 # Filter by position if specified
                 if position and 'Pos' in stats_df.columns:
-                    stats_df = stats_df[
-                        stats_df['Pos'].str.contains(position.upper(), na=False)
-                    ]
+                    stats_df = stats_df[self._contains_ci(stats_df['Pos'], position)]
                 
                 # Add metadata
-                stats_df['Stat_Type'] = stat_type
-                stats_df['Season'] = season
-                stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                stats_df = stats_df.assign(
+                    Stat_Type=stat_type,
+                    Season=season,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return stats_df
+                return self._shrink(stats_df)
             
             return pd.DataFrame()
             
@@ -278,31 +321,29 @@ class NHLScraper(SportsScraper):
             DataFrame with team stats
         """
         try:
+            now = datetime.now()
+            
             # Use ESPN for team stats
             url = self.sources['espn_nhl']
             
             logger.info(f"Fetching NHL team {stat_type} stats")
             
-            team_stats_df = self._parse_table(url)
+            team_stats_df = self._cached_parse(url)
             
-            if team_stats_df is not None and not team_stats_df.empty:
+            if team_stats_df is not None:
                 # Filter by team if specified
                 if team:
                     # Look for team in any column
-                    team_mask = False
-                    for col in team_stats_df.columns:
-                        if team_stats_df[col].dtype == 'object':
-                            team_mask |= team_stats_df[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        team_stats_df = team_stats_df[team_mask]
+                    team_stats_df = self._filter_rows_containing(team_stats_df, team)
                 
                 # Add metadata
-                team_stats_df['Stat_Type'] = stat_type
-                team_stats_df['Season'] = self._get_current_season()
-                team_stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                team_stats_df = team_stats_df.assign(
+                    Stat_Type=stat_type,
+                    Season=self._get_current_season(now),
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return team_stats_df
+                return self._shrink(team_stats_df)
             
             return pd.DataFrame()
             
@@ -315,26 +356,24 @@ class NHLScraper(SportsScraper):
         """Get NHL schedule"""
         try:
             if team:
-                team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
-                url = f"https://www.espn.com/nhl/team/schedule/_/name/{team_abbrev}"
+                team_abbrev = self._lookup_abbrev(team).lower()
+                url = self._url('espn_team_schedule', team=team_abbrev)
             else:
-                url = "https://www.espn.com/nhl/schedule"
+                url = self._url('espn_schedule')
             
             logger.info(f"Fetching NHL schedule")
             
-            schedule_df = self._parse_table(url)
+            schedule_df = self._cached_parse(url)
             
-            if schedule_df is not None and not schedule_df.empty:
+            if schedule_df is not None:
                 # Add metadata
                 schedule_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
                 
                 # Filter by month if specified
                 if month and 'Date' in schedule_df.columns:
-                    schedule_df = schedule_df[
-                        schedule_df['Date'].str.contains(month, case=False, na=False)
-                    ]
+                    schedule_df = schedule_df[self._contains_ci(schedule_df['Date'], month)]
                 
-                return schedule_df
+                return self._shrink(schedule_df)
             
             return pd.DataFrame()
             
@@ -349,20 +388,22 @@ class NHLScraper(SportsScraper):
                 logger.warning("Team name required for roster lookup")
                 return pd.DataFrame()
                 
-            team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
-            url = f"https://www.espn.com/nhl/team/roster/_/name/{team_abbrev}"
+            team_abbrev = self._lookup_abbrev(team).lower()
+            url = self._url('espn_roster', team=team_abbrev)
             
             logger.info(f"Fetching roster for {team}")
             
-            roster_df = self._parse_table(url)
+            roster_df = self._cached_parse(url, ttl_seconds=86400)
             
-            if roster_df is not None and not roster_df.empty:
+            if roster_df is not None:
                 # Add team info
-                roster_df['Team'] = team
-                roster_df['Team_Abbrev'] = self.team_abbrevs.get(team, team.upper())
-                roster_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                roster_df = roster_df.assign(
+                    Team=team,
+                    Team_Abbrev=self._lookup_abbrev(team),
+                    Scraped_Date=datetime.now().strftime('%Y-%m-%d')
+                )
                 
-                return roster_df
+                return self._shrink(roster_df)
             
             return pd.DataFrame()
             
@@ -370,18 +411,73 @@ class NHLScraper(SportsScraper):
             logger.error(f"Error getting roster: {str(e)}")
             return pd.DataFrame()
     
+    def get_all_rosters(self, max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+        """
+        Get rosters for every NHL team concurrently
+        
+        Args:
+            max_workers: Maximum number of teams fetched at once
+            
+        Returns:
+            Dictionary mapping team name to roster DataFrame
+        """
+        return self._run_concurrently(
+            {team: partial(self.get_roster, team) for team in _TEAM_ABBREVS},
+            max_workers=max_workers
+        )
+    
+    def get_all_schedules(self, month: Optional[str] = None,
+                          max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+        """
+        Get schedules for every NHL team concurrently
+        
+        Args:
+            month: Month filter
+            max_workers: Maximum number of teams fetched at once
+            
+        Returns:
+            Dictionary mapping team name to schedule DataFrame
+        """
+        return self._run_concurrently(
+            {team: partial(self.get_schedule, team, month) for team in _TEAM_ABBREVS},
+            max_workers=max_workers
+        )
+    
+    def get_full_season(self, season: Optional[str] = None,
+                        max_workers: int = 4) -> Dict[str, pd.DataFrame]:
+        """
+        Get a full season snapshot from Hockey Reference in one concurrent pass
+        
+        Args:
+            season: Season (e.g., '2023-24'), defaults to the current one
+            max_workers: Maximum number of pages fetched at once
+            
+        Returns:
+            Dictionary with 'standings', 'skaters', 'goalies' and 'playoffs' DataFrames
+        """
+        season = season or self._get_current_season()
+        
+        logger.info(f"Fetching NHL season snapshot for {season}")
+        
+        return self._run_concurrently({
+            'standings': partial(self._get_hockey_ref_standings, season),
+            'skaters': partial(self.get_player_stats, season=season),
+            'goalies': partial(self.get_player_stats, position='G', season=season),
+            'playoffs': partial(self.get_playoffs, season)
+        }, max_workers=max_workers)
+    
     def get_injuries(self) -> pd.DataFrame:
         """Get NHL injury report"""
         try:
-            url = "https://www.espn.com/nhl/injuries"
+            url = self._url('espn_injuries')
             
             logger.info("Fetching NHL injury report")
             
-            injuries_df = self._parse_table(url)
+            injuries_df = self._cached_parse(url, ttl_seconds=300)
             
-            if injuries_df is not None and not injuries_df.empty:
+            if injuries_df is not None:
                 injuries_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return injuries_df
+                return self._shrink(injuries_df)
             
             return pd.DataFrame()
             
@@ -392,23 +488,27 @@ class NHLScraper(SportsScraper):
     def get_playoffs(self, season: Optional[str] = None) -> pd.DataFrame:
         """Get NHL playoff bracket"""
         try:
+            now = datetime.now()
             if not season:
-                season = self._get_current_season()
+                season = self._get_current_season(now)
             
-            year = season.split('-')[1]
-            if len(year) == 2:
-                year = '20' + year
+            year = _season_end_year(season)
             
-            url = f"{self.sources['hockey_reference']}/playoffs/NHL_{year}.html"
+            url = self._url('hr_playoffs', year=year)
             
             logger.info(f"Fetching NHL playoff data for {season}")
             
-            playoff_df = self._parse_table(url)
+            # Past postseasons are final
+            current_year = _season_end_year(self._get_current_season(now))
+            ttl = _FINAL_TTL if year != current_year else 3600
+            playoff_df = self._cached_parse(url, ttl_seconds=ttl)
             
-            if playoff_df is not None and not playoff_df.empty:
-                playoff_df['Season'] = season
-                playoff_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return playoff_df
+            if playoff_df is not None:
+                playoff_df = playoff_df.assign(
+                    Season=season,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
+                return self._shrink(playoff_df)
             
             return pd.DataFrame()
             
@@ -431,31 +531,34 @@ class NHLScraper(SportsScraper):
             DataFrame with draft picks
         """
         try:
+            now = datetime.now()
             if not year:
-                year = datetime.now().year
+                year = now.year
             
-            url = f"{self.sources['hockey_reference']}/draft/NHL_{year}_entry.html"
+            url = self._url('hr_draft', year=year)
             
             logger.info(f"Fetching NHL draft picks for {year}")
             
-            draft_df = self._parse_table(url)
+            # Past drafts are final
+            ttl = _FINAL_TTL if int(year) < now.year else 86400
+            draft_df = self._cached_parse(url, ttl_seconds=ttl, table_id='stats')
             
-            if draft_df is not None and not draft_df.empty:
+            if draft_df is not None:
                 # Filter by team if specified
                 if team and 'Team' in draft_df.columns:
-                    draft_df = draft_df[
-                        draft_df['Team'].str.contains(team, case=False, na=False)
-                    ]
+                    draft_df = draft_df[self._contains_ci(draft_df['Team'], team)]
                 
                 # Filter by round if specified
                 if round and 'Rd' in draft_df.columns:
                     draft_df = draft_df[draft_df['Rd'] == str(round)]
                 
                 # Add metadata
-                draft_df['Draft_Year'] = year
-                draft_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                draft_df = draft_df.assign(
+                    Draft_Year=year,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return draft_df
+                return self._shrink(draft_df)
             
             return pd.DataFrame()
             
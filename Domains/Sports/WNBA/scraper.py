@@ -5,10 +5,6 @@ This module provides specialized scraping for WNBA statistics
 from various sources including WNBA.com, Basketball Reference, and ESPN.
 """
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
-
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 import pandas as pd
@@ -21,10 +17,57 @@ from utils.exceptions import ParsingError, NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Team abbreviations mapping
+_TEAM_ABBREVS = {
+    'Atlanta Dream': 'ATL',
+    'Chicago Sky': 'CHI',
+    'Connecticut Sun': 'CON',
+    'Dallas Wings': 'DAL',
+    'Indiana Fever': 'IND',
+    'Las Vegas Aces': 'LV',
+    'Los Angeles Sparks': 'LA',
+    'Minnesota Lynx': 'MIN',
+    'New York Liberty': 'NY',
+    'Phoenix Mercury': 'PHX',
+    'Seattle Storm': 'SEA',
+    'Washington Mystics': 'WAS'
+}
+
+# Lowercased index accepting full names or abbreviations
+_TEAM_ABBREVS_LC = {
+    **{abbrev.lower(): abbrev for abbrev in _TEAM_ABBREVS.values()},
+    **{name.lower(): abbrev for name, abbrev in _TEAM_ABBREVS.items()}
+}
+
+# Endpoint URL templates ({base} is the Basketball Reference base URL)
+_URLS = {
+    'bbref_standings': '{base}years/WNBA_{year}_standings.html',
+    'bbref_per_game': '{base}years/WNBA_{year}_per_game.html',
+    'bbref_totals': '{base}years/WNBA_{year}_totals.html',
+    'bbref_playoffs': '{base}years/WNBA_{season}_playoffs.html',
+    'bbref_draft': '{base}draft/WNBA_{year}.html',
+    'bbref_allstar': '{base}allstar/WNBA_{year}.html',
+    'espn_scores': 'https://www.espn.com/wnba/scoreboard/_/date/{date}',
+    'espn_schedule': 'https://www.espn.com/wnba/schedule',
+    'espn_team_schedule': 'https://www.espn.com/wnba/team/schedule/_/name/{team}',
+    'espn_roster': 'https://www.espn.com/wnba/team/roster/_/name/{team}',
+    'espn_injuries': 'https://www.espn.com/wnba/injuries',
+}
+
+# Parsed-table TTL for pages that no longer change (past drafts, playoffs, All-Star games)
+_FINAL_TTL = 365 * 86400
+
 
 class WNBAScraper(SportsScraper):
     """WNBA-specific scraper implementation"""
     
+    # Lookup table for SportsScraper._lookup_abbrev
+    _TEAM_ABBREVS_LC = _TEAM_ABBREVS_LC
+    
+    # Templates for SportsScraper._url
+    _URLS = _URLS
+    _URL_BASE_SOURCE = 'basketball_reference'
+    
     def __init__(self):
         """Initialize WNBA scraper"""
         super().__init__(sport='basketball', league='wnba')
@@ -39,21 +82,8 @@ class WNBAScraper(SportsScraper):
             'stats_wnba': 'https://stats.wnba.com'
         })
         
-        # Team abbreviations mapping
-        self.team_abbrevs = {
-            'Atlanta Dream': 'ATL',
-            'Chicago Sky': 'CHI',
-            'Connecticut Sun': 'CON',
-            'Dallas Wings': 'DAL',
-            'Indiana Fever': 'IND',
-            'Las Vegas Aces': 'LV',
-            'Los Angeles Sparks': 'LA',
-            'Minnesota Lynx': 'MIN',
-            'New York Liberty': 'NY',
-            'Phoenix Mercury': 'PHX',
-            'Seattle Storm': 'SEA',
-            'Washington Mystics': 'WAS'
-        }
+        # Team abbreviations mapping (shared, built once at import)
+        self.team_abbrevs = _TEAM_ABBREVS
     
     def get_standings(self, season: Optional[str] = None,
                      conference: Optional[str] = None) -> pd.DataFrame:
@@ -68,23 +98,27 @@ class WNBAScraper(SportsScraper):
             DataFrame with standings
         """
         try:
+            now = datetime.now()
+            
             # Use ESPN for standings
             url = self.sources['espn_wnba']
             
             logger.info(f"Fetching WNBA standings from {url}")
             
             # Scrape the page
-            tables = self._parse_table(url)
+            tables = self._cached_parse(url, ttl_seconds=21600)
             
             if tables is not None and not tables.empty:
                 standings = tables
                 
                 # Add metadata
-                standings['Conference'] = conference or 'WNBA'
-                standings['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                standings['Season'] = season or str(datetime.now().year)
+                standings = standings.assign(
+                    Conference=conference or 'WNBA',
+                    Scraped_Date=now.strftime('%Y-%m-%d'),
+                    Season=season or str(now.year)
+                )
                 
-                return standings
+                return self._shrink(standings)
             
             # Try Basketball Reference as fallback
             return self._get_bbref_standings(season)
@@ -96,18 +130,22 @@ class WNBAScraper(SportsScraper):
     def _get_bbref_standings(self, season: Optional[str] = None) -> pd.DataFrame:
         """Get standings from Basketball Reference"""
         try:
-            year = season or str(datetime.now().year)
-            url = f"{self.sources['basketball_reference']}years/WNBA_{year}_standings.html"
+            now = datetime.now()
+            
+            year = season or str(now.year)
+            url = self._url('bbref_standings', year=year)
             
-            tables = self._parse_table(url)
+            tables = self._cached_parse(url, ttl_seconds=21600)
             
             if tables is not None and not tables.empty:
                 # Add metadata
-                tables['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                tables['Source'] = 'Basketball Reference'
-                tables['Season'] = year
+                tables = tables.assign(
+                    Scraped_Date=now.strftime('%Y-%m-%d'),
+                    Source='Basketball Reference',
+                    Season=year
+                )
                 
-                return tables
+                return self._shrink(tables)
             
             return pd.DataFrame()
             
@@ -128,36 +166,32 @@ class WNBAScraper(SportsScraper):
             DataFrame with scores
         """
         try:
+            now = datetime.now()
+            
             if not date:
-                date = datetime.now()
+                date = now
             
             # Format date for URL
             date_str = date.strftime('%Y%m%d')
             
             # Use ESPN for scores
-            url = f"https://www.espn.com/wnba/scoreboard/_/date/{date_str}"
+            url = self._url('espn_scores', date=date_str)
             
             logger.info(f"Fetching WNBA scores for {date_str}")
             
             # Try to get scores table
-            scores_data = self._parse_table(url)
+            scores_data = self._cached_parse(url, ttl_seconds=300)
             
             if scores_data is not None and not scores_data.empty:
                 # Add date column
                 scores_data['Date'] = date.strftime('%Y-%m-%d')
                 
                 # Filter by team if specified
-                if team and not scores_data.empty:
+                if team:
                     # Look for team in any column
-                    team_mask = False
-                    for col in scores_data.columns:
-                        if scores_data[col].dtype == 'object':
-                            team_mask |= scores_data[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        scores_data = scores_data[team_mask]
+                    scores_data = self._filter_rows_containing(scores_data, team)
                 
-                return scores_data
+                return self._shrink(scores_data)
             
             return pd.DataFrame()
             
@@ -180,38 +214,40 @@ class WNBAScraper(SportsScraper):
             DataFrame with player stats
         """
         try:
+            now = datetime.now()
+            
             # Use Basketball Reference for comprehensive stats
-            year = datetime.now().year
+            year = now.year
             
             if stat_type == 'season':
-                url = f"{self.sources['basketball_reference']}years/WNBA_{year}_per_game.html"
+                url = self._url('bbref_per_game', year=year)
             else:
-                url = f"{self.sources['basketball_reference']}years/WNBA_{year}_totals.html"
+                url = self._url('bbref_totals', year=year)
             
             logger.info(f"Fetching WNBA player {stat_type} stats")
             
-            stats_df = self._parse_table(url)
+            stats_df = self._cached_parse(url, ttl_seconds=86400)
             
             if stats_df is not None and not stats_df.empty:
                 # Filter by player if specified
                 if player and 'Player' in stats_df.columns:
-                    stats_df = stats_df[
-                        stats_df['Player'].str.contains(player, case=False, na=False)
-                    ]
+                    stats_df = stats_df[self._contains_ci(stats_df['Player'], player)]
                 
                 # Filter by team if specified
                 if team and 'Tm' in stats_df.columns:
-                    team_abbrev = self.team_abbrevs.get(team, team.upper())
+                    team_abbrev = self._lookup_abbrev(team)
                     stats_df = stats_df[
                         stats_df['Tm'] == team_abbrev
                     ]
                 
                 # Add metadata
-                stats_df['Stat_Type'] = stat_type
-                stats_df['Season'] = year
-                stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                stats_df = stats_df.assign(
+                    Stat_Type=stat_type,
+                    Season=year,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return stats_df
+                return self._shrink(stats_df)
             
             return pd.DataFrame()
             
@@ -232,31 +268,29 @@ class WNBAScraper(SportsScraper):
             DataFrame with team stats
         """
         try:
+            now = datetime.now()
+            
             # Use ESPN for team stats
             url = self.sources['espn_wnba']
             
             logger.info(f"Fetching WNBA team {stat_type} stats")
             
-            team_stats_df = self._parse_table(url)
+            team_stats_df = self._cached_parse(url, ttl_seconds=21600)
             
             if team_stats_df is not None and not team_stats_df.empty:
                 # Filter by team if specified
                 if team:
                     # Look for team in any column
-                    team_mask = False
-                    for col in team_stats_df.columns:
-                        if team_stats_df[col].dtype == 'object':
-                            team_mask |= team_stats_df[col].str.contains(team, case=False, na=False)
-                    
-                    if hasattr(team_mask, '__iter__'):
-                        team_stats_df = team_stats_df[team_mask]
+                    team_stats_df = self._filter_rows_containing(team_stats_df, team)
                 
                 # Add metadata
-                team_stats_df['Stat_Type'] = stat_type
-                team_stats_df['Season'] = datetime.now().year
-                team_stats_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                team_stats_df = team_stats_df.assign(
+                    Stat_Type=stat_type,
+                    Season=now.year,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return team_stats_df
+                return self._shrink(team_stats_df)
             
             return pd.DataFrame()
             
@@ -268,27 +302,27 @@ class WNBAScraper(SportsScraper):
                     month: Optional[str] = None) -> pd.DataFrame:
         """Get WNBA schedule"""
         try:
+            now = datetime.now()
+            
             if team:
-                team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
-                url = f"https://www.espn.com/wnba/team/schedule/_/name/{team_abbrev}"
+                team_slug = self._lookup_abbrev(team).lower()
+                url = self._url('espn_team_schedule', team=team_slug)
             else:
-                url = "https://www.espn.com/wnba/schedule"
+                url = self._url('espn_schedule')
             
             logger.info(f"Fetching WNBA schedule")
             
-            schedule_df = self._parse_table(url)
+            schedule_df = self._cached_parse(url)
             
             if schedule_df is not None and not schedule_df.empty:
                 # Add metadata
-                schedule_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                schedule_df['Scraped_Date'] = now.strftime('%Y-%m-%d')
                 
                 # Filter by month if specified
                 if month and 'Date' in schedule_df.columns:
-                    schedule_df = schedule_df[
-                        schedule_df['Date'].str.contains(month, case=False, na=False)
-                    ]
+                    schedule_df = schedule_df[self._contains_ci(schedule_df['Date'], month)]
                 
-                return schedule_df
+                return self._shrink(schedule_df)
             
             return pd.DataFrame()
             
@@ -299,24 +333,28 @@ class WNBAScraper(SportsScraper):
     def get_roster(self, team: Optional[str] = None) -> pd.DataFrame:
         """Get WNBA team roster"""
         try:
+            now = datetime.now()
+            
             if not team:
                 logger.warning("Team name required for roster lookup")
                 return pd.DataFrame()
                 
-            team_abbrev = self.team_abbrevs.get(team, team.upper()).lower()
-            url = f"https://www.espn.com/wnba/team/roster/_/name/{team_abbrev}"
+            team_slug = self._lookup_abbrev(team).lower()
+            url = self._url('espn_roster', team=team_slug)
             
             logger.info(f"Fetching roster for {team}")
             
-            roster_df = self._parse_table(url)
+            roster_df = self._cached_parse(url, ttl_seconds=86400)
             
             if roster_df is not None and not roster_df.empty:
                 # Add team info
-                roster_df['Team'] = team
-                roster_df['Team_Abbrev'] = self.team_abbrevs.get(team, team.upper())
-                roster_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                roster_df = roster_df.assign(
+                    Team=team,
+                    Team_Abbrev=self._lookup_abbrev(team),
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return roster_df
+                return self._shrink(roster_df)
             
             return pd.DataFrame()
             
@@ -327,15 +365,17 @@ class WNBAScraper(SportsScraper):
     def get_injuries(self) -> pd.DataFrame:
         """Get WNBA injury report"""
         try:
-            url = "https://www.espn.com/wnba/injuries"
+            now = datetime.now()
+            
+            url = self._url('espn_injuries')
             
             logger.info("Fetching WNBA injury report")
             
-            injuries_df = self._parse_table(url)
+            injuries_df = self._cached_parse(url, ttl_seconds=900)
             
             if injuries_df is not None and not injuries_df.empty:
-                injuries_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return injuries_df
+                injuries_df['Scraped_Date'] = now.strftime('%Y-%m-%d')
+                return self._shrink(injuries_df)
             
             return pd.DataFrame()
             
@@ -346,24 +386,26 @@ class WNBAScraper(SportsScraper):
     def get_playoffs(self, season: Optional[str] = None) -> pd.DataFrame:
         """Get WNBA playoff bracket"""
         try:
-            if not season:
-                # WNBA season runs from May to October
-                current_year = datetime.now().year
-                if datetime.now().month >= 10:
-                    season = str(current_year)
-                else:
-                    season = str(current_year)
+            now = datetime.now()
+            
+            # WNBA seasons run May to October, inside one calendar year
+            season = season or str(now.year)
             
-            url = f"{self.sources['basketball_reference']}years/WNBA_{season}_playoffs.html"
+            url = self._url('bbref_playoffs', season=season)
             
             logger.info(f"Fetching WNBA playoff data for {season}")
             
-            playoff_df = self._parse_table(url)
+            # Past postseasons are final; a non-numeric season just gets the short TTL
+            is_past = str(season).isdigit() and int(season) < now.year
+            ttl = _FINAL_TTL if is_past else 3600
+            playoff_df = self._cached_parse(url, ttl_seconds=ttl)
             
             if playoff_df is not None and not playoff_df.empty:
-                playoff_df['Season'] = season
-                playoff_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return playoff_df
+                playoff_df = playoff_df.assign(
+                    Season=season,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
+                return self._shrink(playoff_df)
             
             return pd.DataFrame()
             
@@ -386,19 +428,23 @@ class WNBAScraper(SportsScraper):
             DataFrame with draft picks
         """
         try:
+            now = datetime.now()
+            
             if not year:
-                year = datetime.now().year
+                year = now.year
             
-            url = f"{self.sources['basketball_reference']}draft/WNBA_{year}.html"
+            url = self._url('bbref_draft', year=year)
             
             logger.info(f"Fetching WNBA draft picks for {year}")
             
-            draft_df = self._parse_table(url)
+            # Past drafts are final
+            ttl = _FINAL_TTL if int(year) < now.year else 86400
+            draft_df = self._cached_parse(url, ttl_seconds=ttl)
             
             if draft_df is not None and not draft_df.empty:
                 # Filter by team if specified
                 if team and 'Tm' in draft_df.columns:
-                    team_abbrev = self.team_abbrevs.get(team, team.upper())
+                    team_abbrev = self._lookup_abbrev(team)
                     draft_df = draft_df[draft_df['Tm'] == team_abbrev]
                 
                 # Filter by round if specified
@@ -406,10 +452,12 @@ class WNBAScraper(SportsScraper):
                     draft_df = draft_df[draft_df['Rd'] == str(round)]
                 
                 # Add metadata
-                draft_df['Draft_Year'] = year
-                draft_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
+                draft_df = draft_df.assign(
+                    Draft_Year=year,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
                 
-                return draft_df
+                return self._shrink(draft_df)
             
             return pd.DataFrame()
             
@@ -428,19 +476,25 @@ class WNBAScraper(SportsScraper):
             DataFrame with All-Star game data
         """
         try:
+            now = datetime.now()
+            
             if not year:
-                year = datetime.now().year
+                year = now.year
             
-            url = f"{self.sources['basketball_reference']}allstar/WNBA_{year}.html"
+            url = self._url('bbref_allstar', year=year)
             
             logger.info(f"Fetching WNBA All-Star Game data for {year}")
             
-            allstar_df = self._parse_table(url)
+            # Past All-Star games are final
+            ttl = _FINAL_TTL if int(year) < now.year else 86400
+            allstar_df = self._cached_parse(url, ttl_seconds=ttl)
             
             if allstar_df is not None and not allstar_df.empty:
-                allstar_df['Year'] = year
-                allstar_df['Scraped_Date'] = datetime.now().strftime('%Y-%m-%d')
-                return allstar_df
+                allstar_df = allstar_df.assign(
+                    Year=year,
+                    Scraped_Date=now.strftime('%Y-%m-%d')
+                )
+                return self._shrink(allstar_df)
             
             return pd.DataFrame()
             
@@ -5,29 +5,85 @@ This module provides the foundation for all sports scrapers with
 common functionality for standings, scores, and stats extraction.
 """
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Any, Union
 from datetime import datetime
+from functools import partial
+from io import StringIO
+from pathlib import Path
+import lxml.html
+import numpy as np
 import pandas as pd
+import atexit
+import hashlib
 import json
 import logging
+import re
+import threading
+import time
 
 from core.web_scraper import WebScraper
 from core.parser import HTMLParser
-from core.exporter import CSVExporter, JSONExporter, MarkdownExporter
+from core.exporter import (
+    CSVExporter, JSONExporter, MarkdownExporter, ParquetExporter, FeatherExporter
+)
 from core.validator import InputValidator
 from utils.rate_limiter import RateLimiter
 from utils.exceptions import ScraperException, NetworkError, ParsingError
 
 logger = logging.getLogger(__name__)
 
+# One WebScraper (and so one pooled keep-alive session) shared by every
+# sports scraper in the process
+_shared_web_scraper: Optional[WebScraper] = None
+_shared_web_scraper_lock = threading.Lock()
+
+
+def _get_shared_web_scraper() -> WebScraper:
+    """Get the process-wide WebScraper, creating it on first use"""
+    global _shared_web_scraper
+    with _shared_web_scraper_lock:
+        if _shared_web_scraper is None:
+            _shared_web_scraper = WebScraper()
+            # Release pooled connections when the interpreter exits
+            atexit.register(_shared_web_scraper.close)
+        return _shared_web_scraper
+
+
+# Cap on in-flight requests per host, across all sports scrapers
+HOST_CONCURRENCY = 4
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _get_host_semaphore(host: str) -> threading.BoundedSemaphore:
+    """Get the semaphore bounding concurrent requests to a host"""
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+        return _host_semaphores[host]
+
+
+# Formats _parse_date tries in order when the fixed-width fast path misses
+_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%m-%d-%Y',
+    '%d %b %Y',
+    '%B %d, %Y'
+)
+
 
 class SportsScraper(ABC):
-    """Base class for all sports domain scrapers"""
+    """
+    Base class for all sports domain scrapers
+    
+    Public getters return frames with compacted dtypes: int64 columns are
+    downcast to the smallest integer type that holds them, and the
+    metadata columns the getters attach (see _CATEGORY_COLUMNS) become
+    category. Scraped stat columns and floats keep their parsed dtypes.
+    """
     
     # Common data types across all sports
     DATA_TYPES = [
@@ -48,6 +104,23 @@ class SportsScraper(ABC):
         'fox': 'https://www.foxsports.com/{sport}/stats'
     }
     
+    # ESPN's JSON APIs behind its scoreboard, roster and standings pages
+    ESPN_API_BASE = 'https://site.api.espn.com/apis/site/v2/sports'
+    ESPN_STANDINGS_API_BASE = 'https://site.api.espn.com/apis/v2/sports'
+    
+    # Repetitive metadata columns that _shrink stores as category
+    _CATEGORY_COLUMNS = frozenset({
+        'Conference', 'Date', 'Draft_Year', 'Position_Group', 'Scraped_Date',
+        'Season', 'Source', 'Stat_Type', 'Team', 'Team_Abbrev', 'Year'
+    })
+    
+    # Lowercased team name -> abbreviation; each league sets its own table
+    _TEAM_ABBREVS_LC: Dict[str, str] = {}
+    
+    # Endpoint URL templates and the source whose URL fills their {base} field
+    _URLS: Dict[str, str] = {}
+    _URL_BASE_SOURCE: Optional[str] = None
+    
     def __init__(self, sport: str, league: str):
         """
         Initialize sports scraper
@@ -58,7 +131,7 @@ class SportsScraper(ABC):
         """
         self.sport = sport.lower()
         self.league = league.upper()
-        self.scraper = WebScraper()
+        self.scraper = _get_shared_web_scraper()
         self.validator = InputValidator()
         # Create a custom organizer without logs directory
         self.data_dir = Path(f"Data/Domains/Sports/{self.league}")
@@ -70,11 +143,21 @@ class SportsScraper(ABC):
         # Data cache for the session
         self.data_cache = {}
         
+        # Parsed tables persisted across runs, next to the scraper's response cache
+        self.parse_cache_dir = self.scraper.cache_dir.parent / "sports" / self.league
+        self.parse_cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Per-table locks so concurrent getters fetch a shared URL only once
+        self._parse_locks: Dict[str, threading.Lock] = {}
+        self._parse_locks_guard = threading.Lock()
+        
         # Initialize exporters
         self.exporters = {
             'csv': CSVExporter(),
             'json': JSONExporter(),
-            'md': MarkdownExporter()
+            'md': MarkdownExporter(),
+            'parquet': ParquetExporter(),
+            'feather': FeatherExporter()
         }
     
     def _get_default_sources(self) -> Dict[str, str]:
@@ -147,59 +230,85 @@ class SportsScraper(ABC):
         pass
     
     def scrape_all(self, data_types: Optional[List[str]] = None,
-                  export_format: str = 'csv') -> Dict[str, Any]:
+                  export_format: str = 'csv',
+                  max_concurrency: int = 6) -> Dict[str, Any]:
         """
         Scrape all requested data types
         
+        Data types are fetched concurrently; each one runs on a worker
+        thread so the blocking fetch/parse of one endpoint does not hold
+        up the others.
+        
         Args:
             data_types: List of data types to scrape
             export_format: Format to export data in
+            max_concurrency: Maximum number of data types in flight at once
             
         Returns:
-            Dictionary with file paths for each data type
+            Dictionary with the file path for each data type (None when
+            the type is unknown, empty or failed)
         """
         if not data_types:
             data_types = ['standings', 'scores', 'player_stats', 'team_stats']
         
-        results = {}
+        # Results come back in request order regardless of completion order
+        return self._run_concurrently(
+            {dt: partial(self._scrape_data_type, dt, export_format)
+             for dt in data_types},
+            max_workers=max_concurrency
+        )
+    
+    def _run_concurrently(self, calls: Dict[str, Callable[[], Any]],
+                          max_workers: int = 6) -> Dict[str, Any]:
+        """
+        Run independent scrape calls on a thread pool
         
-        for data_type in data_types:
-            try:
-                logger.info(f"Scraping {data_type} for {self.league}")
-                
-                # Get the appropriate method
-                method_map = {
-                    'standings': self.get_standings,
-                    'scores': self.get_scores,
-                    'player_stats': self.get_player_stats,
-                    'team_stats': self.get_team_stats,
-                    'schedule': self.get_schedule,
-                    'roster': lambda: self.get_roster() if hasattr(self, 'get_roster') else pd.DataFrame(),
-                    'injuries': self.get_injuries,
-                    'playoffs': self.get_playoffs
-                }
-                
-                if data_type not in method_map:
-                    logger.warning(f"Unknown data type: {data_type}")
-                    continue
-                
-                # Scrape the data
-                data = method_map[data_type]()
-                
-                # Save the data
-                if data is not None and not data.empty:
-                    filename = self._generate_filename(data_type, export_format)
-                    filepath = self._save_data(data, filename, export_format)
-                    results[data_type] = filepath
-                    logger.info(f"Saved {data_type} to {filepath}")
-                else:
-                    logger.warning(f"No data found for {data_type}")
-                    
-            except Exception as e:
-                logger.error(f"Error scraping {data_type}: {str(e)}")
-                results[data_type] = None
+        Fetches still go through the shared session, per-domain delays
+        and per-host concurrency cap.
+        
+        Args:
+            calls: Mapping of result key to zero-argument callable
+            max_workers: Maximum number of calls in flight at once
+            
+        Returns:
+            Dictionary of results in the same key order as calls
+        """
+        results: Dict[str, Any] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fn): key for key, fn in calls.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
-        return results
+        return {key: results[key] for key in calls}
+    
+    def _scrape_data_type(self, data_type: str, export_format: str) -> Optional[Path]:
+        """Scrape and save a single data type, returning the saved file path or None"""
+        try:
+            logger.info(f"Scraping {data_type} for {self.league}")
+            
+            # Resolve the getter, including league-specific ones (e.g. draft_picks)
+            method = getattr(self, f"get_{data_type}", None)
+            if not callable(method):
+                logger.warning(f"Unknown data type: {data_type}")
+                return None
+            
+            # Scrape the data
+            data = method()
+            
+            # Save the data
+            if data is not None and not data.empty:
+                filename = self._generate_filename(data_type, export_format)
+                filepath = self._save_data(data, filename, export_format)
+                logger.info(f"Saved {data_type} to {filepath}")
+                return filepath
+            
+            logger.warning(f"No data found for {data_type}")
+            return None
+                
+        except Exception as e:
+            logger.error(f"Error scraping {data_type}: {str(e)}")
+            return None
     
     def _generate_filename(self, data_type: str, format_type: str) -> str:
         """Generate filename for scraped data"""
@@ -222,7 +331,9 @@ class SportsScraper(ABC):
         return filepath
     
     def _parse_table(self, url: str, table_selector: str = 'table',
-                    table_index: int = 0) -> Optional[pd.DataFrame]:
+                    table_index: int = 0,
+                    table_id: Optional[str] = None,
+                    use_cache: bool = True) -> Optional[pd.DataFrame]:
         """
         Parse a table from a URL
         
@@ -230,9 +341,11 @@ class SportsScraper(ABC):
             url: URL to scrape
             table_selector: CSS selector for table
             table_index: Index of table if multiple exist
+            table_id: HTML id of the table to extract (skips parsing the others)
+            use_cache: Whether the fetch may be served from the HTTP response cache
             
         Returns:
-            DataFrame or None if parsing fails
+            Non-empty DataFrame, or None if parsing fails or finds no rows
         """
         try:
             # Validate URL
@@ -241,23 +354,359 @@ class SportsScraper(ABC):
                 logger.error(f"Invalid URL: {url}")
                 return None
             
-            # Scrape the page
-            scraped_data = self.scraper.scrape(
-                url=validated_url,
-                element_type='table',
-                save=False
-            )
+            host = self.validator.extract_domain(validated_url)
+            with _get_host_semaphore(host):
+                if table_id:
+                    df = self._parse_table_by_id(validated_url, table_id, use_cache)
+                else:
+                    df = self._parse_table_by_index(validated_url, table_index, use_cache)
             
-            if scraped_data and isinstance(scraped_data, list) and len(scraped_data) > table_index:
-                return scraped_data[table_index]
-            elif scraped_data and isinstance(scraped_data, pd.DataFrame):
-                return scraped_data
+            # Empty tables are reported as None so callers need a single check
+            if df is None or df.empty:
+                return None
+            return df
             
+        except Exception as e:
+            logger.error(f"Error parsing table from {url}: {str(e)}")
             return None
+    
+    def _parse_table_by_id(self, url: str, table_id: str,
+                           use_cache: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Parse a single table located by id with lxml XPath
+        
+        Args:
+            url: Validated URL to scrape
+            table_id: HTML id of the table
+            use_cache: Whether the fetch may be served from the HTTP response cache
+            
+        Returns:
+            DataFrame or None if the table is not found
+        """
+        tree = self._fetch_tree(url, use_cache)
+        xpath = f'//table[@id="{table_id}"]'
+        nodes = tree.xpath(xpath)
+        
+        if not nodes:
+            # Sports Reference ships some tables inside HTML comments
+            for comment in tree.xpath('//comment()'):
+                if comment.text and table_id in comment.text:
+                    nodes = lxml.html.fromstring(comment.text).xpath(xpath)
+                    if nodes:
+                        break
+        
+        if not nodes:
+            logger.warning(f"Table '{table_id}' not found at {url}")
+            return None
+        
+        return self._read_table_node(nodes[0])
+    
+    def _parse_table_by_index(self, url: str, table_index: int,
+                              use_cache: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Parse the n-th readable table on a page, stopping once it is found
+        
+        Tables pandas cannot read are skipped, matching HTMLParser.parse_tables
+        indexing, but tables after the requested one are never converted.
+        
+        Args:
+            url: Validated URL to scrape
+            table_index: Index of the table among readable tables
+            use_cache: Whether the fetch may be served from the HTTP response cache
             
+        Returns:
+            DataFrame or None if the page has too few tables
+        """
+        tree = self._fetch_tree(url, use_cache)
+        
+        found = -1
+        for node in tree.iter('table'):
+            try:
+                df = self._read_table_node(node)
+            except Exception as e:
+                logger.debug(f"Skipping unreadable table at {url}: {e}")
+                continue
+            
+            found += 1
+            if found == table_index:
+                return df
+        
+        logger.warning(f"Table {table_index} not found at {url}")
+        return None
+    
+    def _fetch_tree(self, url: str, use_cache: bool = True) -> lxml.html.HtmlElement:
+        """Fetch a page through the shared scraper and parse it with lxml"""
+        domain = self.validator.extract_domain(url)
+        self.scraper.rate_limiter.wait_if_needed(domain)
+        response = self.scraper.fetch(url, use_cache=use_cache)
+        return lxml.html.fromstring(response.text)
+    
+    @staticmethod
+    def _read_table_node(node: lxml.html.HtmlElement) -> pd.DataFrame:
+        """Convert a single lxml <table> element to a DataFrame"""
+        table_html = lxml.html.tostring(node, encoding='unicode')
+        return pd.read_html(StringIO(table_html), flavor='lxml')[0]
+    
+    def _get_espn_json(self, path: str, use_cache: bool = True,
+                       api_base: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one of ESPN's JSON API endpoints for this league
+        
+        Args:
+            path: Endpoint path after the league segment (e.g. 'scoreboard?dates=20240101')
+            use_cache: Whether the shared response cache may serve this call
+            api_base: API root to use instead of ESPN_API_BASE
+            
+        Returns:
+            Decoded JSON payload, or None if the API call fails
+        """
+        # ESPN's API paths are lowercase, unlike self.league
+        url = f"{api_base or self.ESPN_API_BASE}/{self.sport}/{self.league.lower()}/{path}"
+        
+        try:
+            host = self.validator.extract_domain(url)
+            with _get_host_semaphore(host):
+                self.scraper.rate_limiter.wait_if_needed(host)
+                return self.scraper.fetch(url, use_cache=use_cache).json()
         except Exception as e:
-            logger.error(f"Error parsing table from {url}: {str(e)}")
+            logger.warning(f"ESPN API call failed for {url}: {e}")
+            return None
+    
+    def _get_espn_scoreboard(self, date_str: str) -> Optional[pd.DataFrame]:
+        """
+        Get a day's games from ESPN's JSON scoreboard API
+        
+        Args:
+            date_str: Date in YYYYMMDD format
+            
+        Returns:
+            DataFrame with one row per game, or None if the API call fails
+        """
+        # Live scores: never serve this from the hour-long response cache
+        payload = self._get_espn_json(f"scoreboard?dates={date_str}", use_cache=False)
+        if payload is None:
             return None
+        
+        rows = []
+        for event in payload.get('events', []):
+            competition = (event.get('competitions') or [{}])[0]
+            sides = {c.get('homeAway'): c for c in competition.get('competitors', [])}
+            away = sides.get('away', {})
+            home = sides.get('home', {})
+            
+            rows.append({
+                'Game': event.get('name'),
+                'Status': event.get('status', {}).get('type', {}).get('description'),
+                'Away': away.get('team', {}).get('displayName'),
+                'Away_Score': away.get('score'),
+                'Home': home.get('team', {}).get('displayName'),
+                'Home_Score': home.get('score'),
+                'Start_Time': event.get('date')
+            })
+        
+        return pd.DataFrame(rows)
+    
+    def _get_espn_roster(self, team_abbrev: str) -> Optional[pd.DataFrame]:
+        """
+        Get a team's roster from ESPN's JSON roster API
+        
+        Args:
+            team_abbrev: ESPN team abbreviation (e.g. 'kc')
+            
+        Returns:
+            DataFrame with one row per player, or None if the API call fails
+        """
+        payload = self._get_espn_json(f"teams/{team_abbrev.lower()}/roster")
+        if payload is None:
+            return None
+        
+        # Football rosters group athletes by unit; other sports list them flat
+        athletes = []
+        for entry in payload.get('athletes', []):
+            athletes.extend(entry['items'] if 'items' in entry else [entry])
+        
+        rows = []
+        for athlete in athletes:
+            rows.append({
+                'Name': athlete.get('fullName'),
+                'Jersey': athlete.get('jersey'),
+                'Position': (athlete.get('position') or {}).get('abbreviation'),
+                'Age': athlete.get('age'),
+                'Height': athlete.get('displayHeight'),
+                'Weight': athlete.get('displayWeight'),
+                'Experience': (athlete.get('experience') or {}).get('years'),
+                'College': (athlete.get('college') or {}).get('name')
+            })
+        
+        return pd.DataFrame(rows)
+    
+    def _get_espn_standings(self, season: Optional[str] = None,
+                            group: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Get standings from ESPN's JSON standings API
+        
+        Args:
+            season: Season year (defaults to ESPN's current season)
+            group: Conference/league abbreviation to keep (e.g. 'AFC')
+            
+        Returns:
+            DataFrame with one row per team, or None if the API call fails
+        """
+        path = f"standings?season={season}" if season else 'standings'
+        # The site/v2 standings endpoint is a stub; the full tables live under apis/v2
+        payload = self._get_espn_json(path, api_base=self.ESPN_STANDINGS_API_BASE)
+        if payload is None:
+            return None
+        
+        rows = []
+        for child in payload.get('children', []):
+            group_abbrev = child.get('abbreviation')
+            if group and (group_abbrev or '').upper() != group.upper():
+                continue
+            
+            for entry in child.get('standings', {}).get('entries', []):
+                team = entry.get('team', {})
+                row = {
+                    'Group': group_abbrev,
+                    'Team': team.get('displayName'),
+                    'Team_Abbrev': team.get('abbreviation')
+                }
+                for stat in entry.get('stats', []):
+                    row[stat.get('displayName') or stat.get('name')] = stat.get('displayValue')
+                rows.append(row)
+        
+        return pd.DataFrame(rows)
+    
+    def _cached_parse(self, url: str, ttl_seconds: int = 3600,
+                      **kwargs) -> Optional[pd.DataFrame]:
+        """
+        Parse a table from a URL, reusing a recently parsed copy from disk
+        
+        Args:
+            url: URL to scrape
+            ttl_seconds: How long a parsed table stays valid
+            **kwargs: Additional arguments for _parse_table
+            
+        Returns:
+            DataFrame or None if parsing fails
+        """
+        key_str = json.dumps({'url': url, **kwargs}, sort_keys=True)
+        key = hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
+        cache_file = self.parse_cache_dir / f"{key}.pkl"
+        
+        with self._parse_locks_guard:
+            parse_lock = self._parse_locks.setdefault(key, threading.Lock())
+        
+        # A concurrent caller for the same table waits here, then hits the cache
+        with parse_lock:
+            if cache_file.exists() and time.time() - cache_file.stat().st_mtime < ttl_seconds:
+                try:
+                    logger.debug(f"Parsed table cache hit for {url}")
+                    return pd.read_pickle(cache_file)
+                except Exception as e:
+                    logger.warning(f"Error reading parsed table cache: {e}")
+            
+            # A response cached longer than this entry's TTL would serve stale pages
+            use_cache = ttl_seconds >= self.scraper.cache_ttl
+            df = self._parse_table(url, use_cache=use_cache, **kwargs)
+            
+            if df is not None:
+                try:
+                    df.to_pickle(cache_file)
+                except Exception as e:
+                    logger.warning(f"Error saving parsed table cache: {e}")
+            
+            return df
+    
+    def _shrink(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast integer columns and categorize the metadata columns we add
+        
+        Args:
+            df: DataFrame to shrink (left unchanged; callers often pass slices)
+            
+        Returns:
+            A new DataFrame with smaller dtypes
+        """
+        dtypes = {}
+        for col in df.select_dtypes(include='int64').columns:
+            dtypes[col] = pd.to_numeric(df[col], downcast='integer').dtype
+        
+        for col in self._CATEGORY_COLUMNS.intersection(df.columns):
+            if df[col].dtype == object:
+                dtypes[col] = 'category'
+        
+        return df.astype(dtypes) if dtypes else df.copy()
+    
+    def _url(self, name: str, **params: Any) -> str:
+        """
+        Build an endpoint URL from the league's template
+        
+        Args:
+            name: Key in _URLS
+            **params: Values for the template's placeholders
+            
+        Returns:
+            The filled-in URL
+        """
+        base = self.sources[self._URL_BASE_SOURCE] if self._URL_BASE_SOURCE else ''
+        return self._URLS[name].format_map({'base': base, **params})
+    
+    def _lookup_abbrev(self, team: str) -> str:
+        """
+        Get the abbreviation for a team name, case-insensitively
+        
+        Args:
+            team: Team name (or abbreviation, where the league table lists it)
+            
+        Returns:
+            The league abbreviation, or the input uppercased if unknown
+        """
+        abbrev = self._TEAM_ABBREVS_LC.get(team.lower())
+        # Not dict.get's default: that would build the uppercase string on every hit
+        if abbrev is None:
+            abbrev = team.upper()
+        return abbrev
+    
+    def _contains_ci(self, series: pd.Series, needle: str) -> pd.Series:
+        """
+        Case-insensitive literal substring match
+        
+        Args:
+            series: Text column to search
+            needle: Text to look for (regex metacharacters match literally)
+            
+        Returns:
+            Boolean mask, False for missing values
+        """
+        return series.str.contains(needle, case=False, na=False, regex=False)
+    
+    def _filter_rows_containing(self, df: pd.DataFrame, text: str) -> pd.DataFrame:
+        """
+        Keep rows where any text column contains the given text
+        
+        Args:
+            df: DataFrame to filter
+            text: Case-insensitive text to look for
+            
+        Returns:
+            Filtered DataFrame, or df unchanged if it has no text columns
+        """
+        text_cols = df.select_dtypes(include='object')
+        if text_cols.columns.empty:
+            # Nothing to search: leave the frame unfiltered, as the getters always have
+            return df
+        
+        # Compile once and OR per-column matches into a preallocated mask
+        pattern = re.compile(re.escape(text), re.IGNORECASE)
+        mask = np.zeros(len(df), dtype=bool)
+        for col in text_cols.columns:
+            values = text_cols[col]
+            # Stringify non-str cells, but keep missing ones missing so they never match
+            values = values.astype(str).where(values.notna())
+            mask |= values.str.contains(pattern, na=False).to_numpy()
+        
+        return df[mask]
     
     def _normalize_team_name(self, team: str) -> str:
         """Normalize team name for consistency"""
@@ -276,15 +725,17 @@ class SportsScraper(ABC):
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats"""
-        date_formats = [
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-            '%m-%d-%Y',
-            '%d %b %Y',
-            '%B %d, %Y'
-        ]
-        
-        for fmt in date_formats:
+        # YYYY-MM-DD and MM/DD/YYYY are by far the most common; slice them directly
+        if len(date_str) == 10:
+            try:
+                if date_str[4] == '-' and date_str[7] == '-':
+                    return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+                if date_str[2] == '/' and date_str[5] == '/':
+                    return datetime(int(date_str[6:]), int(date_str[:2]), int(date_str[3:5]))
+            except ValueError:
+                pass
+        
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
@@ -0,0 +1,6 @@
+"""
+Domain-specific scrapers for Master Data Scraper
+
+This package groups scrapers tailored to particular subject areas,
+such as sports leagues.
+"""
@@ -7,7 +7,10 @@ This module contains the main scraping logic, parsing, exporting, and organizati
 from .scraper import BaseScraper
 from .web_scraper import WebScraper
 from .parser import HTMLParser
-from .exporter import ExporterFactory, CSVExporter, JSONExporter, MarkdownExporter, TextExporter
+from .exporter import (
+    ExporterFactory, CSVExporter, JSONExporter, MarkdownExporter, TextExporter,
+    ParquetExporter, FeatherExporter
+)
 from .organizer import FileOrganizer
 from .validator import InputValidator
 from .async_scraper import AsyncWebScraper, scrape_urls_async
@@ -24,6 +27,8 @@ __all__ = [
     'JSONExporter',
     'MarkdownExporter',
     'TextExporter',
+    'ParquetExporter',
+    'FeatherExporter',
     'FileOrganizer',
     'InputValidator',
     'WebCrawler',
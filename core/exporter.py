@@ -1,7 +1,7 @@
 """
 Export module for saving scraped data in various formats
 
-This module provides exporters for CSV, JSON, Markdown, and plain text formats.
+This module provides exporters for CSV, JSON, Markdown, plain text, Parquet and Feather formats.
 """
 
 from abc import ABC, abstractmethod
@@ -193,9 +193,15 @@ class JSONExporter(BaseExporter):
             else:
                 export_data = data
             
-            # Write JSON with pretty printing
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, **kwargs)
+            # Prefer orjson when installed; json.dump kwargs have no orjson equivalent
+            payload = self._orjson_dumps(export_data) if not kwargs else None
+            
+            if payload is not None:
+                filepath.write_bytes(payload)
+            else:
+                # Write JSON with pretty printing
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False, **kwargs)
             
             logger.info(f"Exported JSON to {filepath}")
             return filepath
@@ -203,6 +209,31 @@ class JSONExporter(BaseExporter):
         except Exception as e:
             logger.error(f"Error exporting JSON: {str(e)}")
             raise
+    
+    @staticmethod
+    def _orjson_dumps(data: Any) -> Optional[bytes]:
+        """
+        Serialize data with orjson if it is installed
+        
+        Args:
+            data: Data to serialize
+            
+        Returns:
+            Indented UTF-8 JSON bytes, or None if orjson is missing or cannot encode the data
+        """
+        try:
+            import orjson
+        except ImportError:
+            return None
+        
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # Types orjson does not know; the stdlib path reports the real error
+            return None
 
 
 class MarkdownExporter(BaseExporter):
@@ -355,6 +386,88 @@ class TextExporter(BaseExporter):
             raise
 
 
+class ParquetExporter(BaseExporter):
+    """Exporter for Parquet format (requires pyarrow)"""
+    
+    def export(self, data: Any, filepath: Path,
+               compression: str = 'zstd', **kwargs) -> Path:
+        """
+        Export data to Parquet file
+        
+        Args:
+            data: DataFrame or list of dicts
+            filepath: Output file path
+            compression: Parquet compression codec
+            
+        Returns:
+            Path to the exported file
+        """
+        filepath = filepath.with_suffix('.parquet')
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            from utils.exceptions import ExportError
+            raise ExportError("Parquet export requires pyarrow (pip install pyarrow)",
+                              format_type='parquet', file_path=str(filepath))
+        
+        try:
+            if not isinstance(data, pd.DataFrame):
+                data = pd.DataFrame(data)
+            
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            pq.write_table(table, filepath, compression=compression, **kwargs)
+            
+            logger.info(f"Exported Parquet to {filepath}")
+            return filepath
+            
+        except Exception as e:
+            logger.error(f"Error exporting Parquet: {str(e)}")
+            raise
+
+
+class FeatherExporter(BaseExporter):
+    """Exporter for Feather (Arrow IPC) format (requires pyarrow)"""
+    
+    def export(self, data: Any, filepath: Path,
+               compression: str = 'zstd', **kwargs) -> Path:
+        """
+        Export data to Feather file
+        
+        Args:
+            data: DataFrame or list of dicts
+            filepath: Output file path
+            compression: Feather compression codec
+            
+        Returns:
+            Path to the exported file
+        """
+        filepath = filepath.with_suffix('.feather')
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+        except ImportError:
+            from utils.exceptions import ExportError
+            raise ExportError("Feather export requires pyarrow (pip install pyarrow)",
+                              format_type='feather', file_path=str(filepath))
+        
+        try:
+            if not isinstance(data, pd.DataFrame):
+                data = pd.DataFrame(data)
+            
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            feather.write_feather(table, filepath, compression=compression, **kwargs)
+            
+            logger.info(f"Exported Feather to {filepath}")
+            return filepath
+            
+        except Exception as e:
+            logger.error(f"Error exporting Feather: {str(e)}")
+            raise
+
+
 class ExporterFactory:
     """Factory class for creating appropriate exporters"""
     
@@ -365,6 +478,8 @@ class ExporterFactory:
         'markdown': MarkdownExporter,
         'txt': TextExporter,
         'text': TextExporter,
+        'parquet': ParquetExporter,
+        'feather': FeatherExporter,
     }
     
     @classmethod
@@ -373,7 +488,7 @@ class ExporterFactory:
         Create an exporter for the specified format
         
         Args:
-            format_type: Export format (csv, json, md, txt)
+            format_type: Export format (csv, json, md, txt, parquet, feather)
             **kwargs: Additional arguments for exporter initialization
             
         Returns:
@@ -6,6 +6,7 @@ tables, headings, paragraphs, lists, and links.
 """
 
 from typing import List, Dict, Any, Optional, Union
+from io import StringIO
 from bs4 import BeautifulSoup, Tag
 import pandas as pd
 import logging
@@ -142,9 +143,8 @@ class HTMLParser:
         
         for i, table in enumerate(tables):
             try:
-                # Extract table data
-                from io import StringIO
-                df = pd.read_html(StringIO(str(table)))[0]
+                # Extract table data (lxml only, no bs4/html5lib probing)
+                df = pd.read_html(StringIO(str(table)), flavor='lxml')[0]
                 dataframes.append(df)
                 logger.debug(f"Parsed table {i} with shape {df.shape}")
             except Exception as e:
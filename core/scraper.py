@@ -185,29 +185,60 @@ class BaseScraper(ABC):
                 return response
         
         # Check disk cache
-        cache_file = self.cache_dir / f"{cache_key}.cache"
-        if cache_file.exists():
-            try:
-                cache_data = json.loads(cache_file.read_text())
-                cached_time = datetime.fromisoformat(cache_data['cached_at'])
-                
-                if datetime.now() - cached_time < timedelta(seconds=self.cache_ttl):
-                    # Reconstruct response
-                    response = requests.Response()
-                    response.status_code = cache_data['status_code']
-                    response.headers = requests.structures.CaseInsensitiveDict(cache_data['headers'])
-                    response._content = cache_data['content'].encode(cache_data['encoding'])
-                    response.encoding = cache_data['encoding']
-                    response.url = cache_data['url']
-                    
-                    self.stats['cache_hits'] += 1
-                    logger.debug(f"Disk cache hit for key {cache_key[:8]}")
-                    return response
-            except Exception as e:
-                logger.warning(f"Error reading cache: {e}")
+        cached = self._load_disk_cache(cache_key)
+        if cached:
+            response, cached_time = cached
+            if datetime.now() - cached_time < timedelta(seconds=self.cache_ttl):
+                self.stats['cache_hits'] += 1
+                logger.debug(f"Disk cache hit for key {cache_key[:8]}")
+                return response
         
         return None
     
+    def _load_disk_cache(self, cache_key: str) -> Optional[Tuple[requests.Response, datetime]]:
+        """Load a cached response and the time it was cached, ignoring TTL"""
+        cache_file = self.cache_dir / f"{cache_key}.cache"
+        if not cache_file.exists():
+            return None
+        
+        try:
+            cache_data = json.loads(cache_file.read_text())
+            
+            # Reconstruct response
+            response = requests.Response()
+            response.status_code = cache_data['status_code']
+            response.headers = requests.structures.CaseInsensitiveDict(cache_data['headers'])
+            response._content = cache_data['content'].encode(cache_data['encoding'])
+            response.encoding = cache_data['encoding']
+            response.url = cache_data['url']
+            
+            return response, datetime.fromisoformat(cache_data['cached_at'])
+        except Exception as e:
+            logger.warning(f"Error reading cache: {e}")
+            return None
+    
+    def _get_stale_from_cache(self, cache_key: str) -> Optional[requests.Response]:
+        """Get an expired cached response that can still be revalidated"""
+        if cache_key in self._memory_cache:
+            return self._memory_cache[cache_key][0]
+        
+        cached = self._load_disk_cache(cache_key)
+        return cached[0] if cached else None
+    
+    def _conditional_headers(self, response: requests.Response) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cached response"""
+        headers = {}
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            headers['If-None-Match'] = etag
+        
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        return headers
+    
     def _save_to_cache(self, cache_key: str, response: requests.Response) -> None:
         """Save response to cache"""
         # Save to memory cache
@@ -317,11 +348,23 @@ class BaseScraper(ABC):
         self.stats['requests_made'] += 1
         
         # Check cache if enabled
+        cache_key = None
+        stale_response = None
         if use_cache and method.upper() == "GET":
             cache_key = self._get_cache_key(url, method, **kwargs)
             cached_response = self._get_from_cache(cache_key)
             if cached_response:
                 return cached_response
+            
+            # Revalidate an expired entry so an unchanged page costs a 304
+            # instead of a full download
+            stale_response = self._get_stale_from_cache(cache_key)
+            if stale_response is not None:
+                validators = self._conditional_headers(stale_response)
+                if validators:
+                    kwargs.setdefault('headers', {}).update(validators)
+                else:
+                    stale_response = None
         
         # Add timeout if not specified
         kwargs.setdefault('timeout', self.timeout)
@@ -408,6 +451,13 @@ class BaseScraper(ABC):
                             response=response
                         )
                 
+                # Server confirmed the cached copy is still current
+                if response.status_code == 304 and stale_response is not None:
+                    self.stats['cache_hits'] += 1
+                    logger.debug(f"Not modified, reusing cached response for {url}")
+                    self._save_to_cache(cache_key, stale_response)
+                    return stale_response
+                
                 # Detect and set proper encoding
                 response.encoding = self._detect_encoding(response)
                 
@@ -423,8 +473,7 @@ class BaseScraper(ABC):
                     self._session_cookies[domain].update(response.cookies.get_dict())
                 
                 # Cache successful responses
-                if use_cache and method.upper() == "GET" and response.status_code == 200:
-                    cache_key = self._get_cache_key(url, method, **kwargs)
+                if cache_key and response.status_code == 200:
                     self._save_to_cache(cache_key, response)
                 
                 # Apply post-request delay based on response
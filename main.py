@@ -13,9 +13,6 @@ from typing import Optional
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.logging import RichHandler
 
 # Initialize console for rich output
 console = Console()
@@ -24,8 +21,10 @@ __version__ = "1.0.0"
 __author__ = "Luke Fournier"
 
 
-def setup_logging(debug: bool = False) -> None:
+def setup_logging(debug: bool = False, quiet: bool = False) -> None:
     """Set up logging configuration"""
+    from rich.logging import RichHandler
+    
     level = logging.DEBUG if debug else logging.INFO
     
     # Create logs directory
@@ -39,6 +38,8 @@ def setup_logging(debug: bool = False) -> None:
         show_path=debug,
         markup=True
     )
+    if quiet:
+        console_handler.setLevel(logging.WARNING)
     
     # Configure file handler
     file_handler = logging.FileHandler(
@@ -73,7 +74,8 @@ def signal_handler(signum, frame):
 @click.pass_context
 @click.version_option(version=__version__, prog_name="Master Data Scraper")
 @click.option('--debug', is_flag=True, help='Enable debug mode')
-def cli(ctx: click.Context, debug: bool = False):
+@click.option('--quiet', '-q', is_flag=True, help='Suppress banner and info logging')
+def cli(ctx: click.Context, debug: bool = False, quiet: bool = False):
     """
     Master Data Scraper - Professional web scraping made simple.
     
@@ -83,9 +85,10 @@ def cli(ctx: click.Context, debug: bool = False):
     # Store debug flag in context
     ctx.ensure_object(dict)
     ctx.obj['debug'] = debug
+    ctx.obj['quiet'] = quiet
     
     # Set up logging
-    setup_logging(debug)
+    setup_logging(debug, quiet)
     
     # Set up signal handler
     signal.signal(signal.SIGINT, signal_handler)
@@ -103,15 +106,19 @@ def interactive(ctx: click.Context):
     debug = ctx.obj.get('debug', False)
     
     try:
-        # Display welcome banner
-        welcome_text = Text.from_markup(
-            "[bold cyan]MASTER DATA SCRAPER[/bold cyan] v" + __version__ + "\n" +
-            "[italic]Professional Web Scraping Made Simple[/italic]"
-        )
-        console.print(Panel(welcome_text, border_style="cyan", padding=1))
-        
-        console.print("\nWelcome! This tool helps you extract data from websites.")
-        console.print("All data will be saved to the Data/ folder, organized by domain.\n")
+        # Display welcome banner (skipped when quiet or output is piped)
+        if console.is_terminal and not ctx.obj.get('quiet', False):
+            from rich.panel import Panel
+            from rich.text import Text
+            
+            welcome_text = Text.from_markup(
+                "[bold cyan]MASTER DATA SCRAPER[/bold cyan] v" + __version__ + "\n" +
+                "[italic]Professional Web Scraping Made Simple[/italic]"
+            )
+            console.print(Panel(welcome_text, border_style="cyan", padding=1))
+            
+            console.print("\nWelcome! This tool helps you extract data from websites.")
+            console.print("All data will be saved to the Data/ folder, organized by domain.\n")
         
         # Import and run the interactive CLI
         from utils.cli import InteractiveCLI
@@ -204,7 +211,8 @@ def scrape(ctx: click.Context, url: str, element: str, format: str,
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
-            transient=True
+            transient=True,
+            disable=not console.is_terminal
         ) as progress:
             task = progress.add_task(f"Scraping {url}...", total=None)
             
@@ -425,7 +433,8 @@ def crawl(ctx: click.Context, url: str, element: str, keywords: Optional[str],
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("{task.completed}/{task.total}"),
-            console=console
+            console=console,
+            disable=not console.is_terminal
         )
         
         with progress:
@@ -514,7 +523,8 @@ def smart_crawl(ctx: click.Context, url: str, element: str, keywords: Optional[s
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("{task.completed}/{task.total}"),
-            console=console
+            console=console,
+            disable=not console.is_terminal
         )
         
         with progress:
@@ -667,7 +677,8 @@ def sports(ctx: click.Context, url: str, tables: Optional[str], format: str, wai
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
-            transient=True
+            transient=True,
+            disable=not console.is_terminal
         ) as progress:
             task = progress.add_task(f"Scraping sports data from {url}...", total=None)
             
@@ -581,6 +581,12 @@ class InteractiveCLI:
         
         if hasattr(data, 'head') and hasattr(data, 'shape'):  # DataFrame
             self.console.print(f"\n[{Theme.INFO}]DataFrame with {data.shape[0]} rows and {data.shape[1]} columns[/{Theme.INFO}]")
+            
+            # Plain text is enough when output is piped or redirected
+            if not self.console.is_terminal:
+                self.console.out(data.head(5).to_string(index=False))
+                return
+            
             # Convert DataFrame to rich Table
             table = Table(show_header=True, header_style=f"bold {Theme.PRIMARY}", box=box.ROUNDED)
             
@@ -589,8 +595,9 @@ class InteractiveCLI:
                 table.add_column(str(col), style=Theme.MUTED)
             
             # Add preview rows (max 5)
-            for idx, row in data.head(5).iterrows():
-                table.add_row(*[str(val) for val in row])
+            preview = data.head(5).astype(str)
+            for row in preview.itertuples(index=False, name=None):
+                table.add_row(*row)
             
             self.console.print(table)
             if data.shape[0] > 5:
@@ -37,6 +37,22 @@ class RateLimiter:
         self.domain_delays = domain_delays or {}
         self.last_request_time = defaultdict(float)
         self.lock = Lock()
+        self._domain_locks: Dict[str, Lock] = {}
+    
+    def _get_domain_lock(self, domain: str) -> Lock:
+        """
+        Get the lock guarding a single domain's request timing
+        
+        Args:
+            domain: Domain name
+            
+        Returns:
+            Lock for the domain
+        """
+        with self.lock:
+            if domain not in self._domain_locks:
+                self._domain_locks[domain] = Lock()
+            return self._domain_locks[domain]
     
     def get_delay_for_domain(self, domain: str) -> float:
         """
@@ -60,7 +76,8 @@ class RateLimiter:
         Returns:
             Actual wait time in seconds
         """
-        with self.lock:
+        # Only requests to the same domain queue behind each other
+        with self._get_domain_lock(domain):
             current_time = time.time()
             last_request = self.last_request_time[domain]
             required_delay = self.get_delay_for_domain(domain)